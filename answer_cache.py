@@ -0,0 +1,256 @@
+import os
+import re
+import json
+import zlib
+import hashlib
+import threading
+import numpy as np
+
+# Questions already answered by the AI, stored one JSON object per line so a
+# new answer is a cheap append instead of rewriting the whole file.
+CACHE_FILE = "answer_cache.jsonl"
+
+# Cosine similarity a new question needs to reuse a stored answer.
+SIMILARITY_THRESHOLD = float(os.getenv("ANSWER_CACHE_THRESHOLD", "0.8"))
+
+# Size of the hashed character n-gram vectors.
+VECTOR_DIM = 512
+NGRAM_SIZE = 3
+
+# Stats fields that change on every run and must not change the profile key.
+VOLATILE_FIELDS = ("application_count", "is_premium")
+
+# Words that say nothing about *what* is being asked. They are dropped before
+# vectorizing so "How many years have you worked with Python?" and "Python
+# experience (years)" compare as the same question, while "Years of experience
+# with Java" stays far away from the Python one.
+GENERIC_WORDS = {
+    "a", "an", "the", "of", "in", "on", "at", "to", "for", "with", "and", "or",
+    "by", "as", "is", "are", "do", "does", "did", "have", "has", "had", "you",
+    "your", "yours", "i", "me", "my", "we", "our", "it", "this", "that", "be",
+    "been", "how", "many", "much", "what", "which", "please", "enter", "provide",
+    "number", "total", "years", "year", "yrs", "yr", "experience", "experienced",
+    "work", "worked", "working", "professional", "overall", "relevant",
+    "hands", "using", "used", "use",
+}
+
+# Dropping the generic words also drops what kind of answer is wanted, so
+# every question is tagged with a type and only matched within that type.
+# "Do you have experience with Python?" must never reuse the "5" stored
+# for "How many years of experience do you have with Python?".
+YES_NO_STARTERS = {
+    "do", "does", "did", "are", "is", "was", "were", "have", "has", "had",
+    "can", "could", "will", "would", "should", "may", "shall",
+}
+NUMERIC_MARKERS = re.compile(
+    r"\b(?:how many|how much|how long|number of|years?|yrs?|months?|salary|ctc|"
+    r"compensation|notice period|rate|gpa|percentage|score)\b"
+)
+
+# Words that flip a question's meaning. "t" is what's left of "n't" once
+# punctuation is stripped. Two questions that differ in any of these, or
+# where one word is the other with an "un"/"non"/"in"/"dis" prefix
+# ("employed" / "unemployed"), never share an answer.
+NEGATION_WORDS = {"not", "no", "never", "non", "without", "cannot", "neither", "nor", "t"}
+NEGATION_PREFIXES = ("un", "non", "in", "dis")
+
+# Prompt the LinkedIn bot sends for each checkbox. Only the label inside it
+# is cached; the shared wording would otherwise make every checkbox match.
+CHECKBOX_QUESTION = "Should I check the box for: '{}'? Answer Yes or No."
+_CHECKBOX_PATTERN = re.compile(
+    "^" + re.escape(CHECKBOX_QUESTION).replace(re.escape("{}"), "(.*)") + "$", re.DOTALL
+)
+
+
+def _normalize(question):
+    text = re.sub(r"[^a-z0-9+#.]+", " ", question.lower())
+    return " ".join(w.strip(".") for w in text.split() if w.strip("."))
+
+
+def _parse(question):
+    """
+    Returns (normalized question, question type). Checkbox prompts are
+    reduced to their label and always treated as yes/no.
+    """
+    checkbox = _CHECKBOX_PATTERN.match(question.strip())
+    if checkbox:
+        return _normalize(checkbox.group(1)), "yes_no"
+    normalized = _normalize(question)
+    return normalized, _question_type(normalized)
+
+
+def _question_type(normalized):
+    words = normalized.split()
+    if words and words[0] in YES_NO_STARTERS:
+        return "yes_no"
+    if NUMERIC_MARKERS.search(normalized):
+        return "numeric"
+    return "text"
+
+
+def _key_terms(normalized):
+    terms = [w for w in normalized.split() if w not in GENERIC_WORDS or w in NEGATION_WORDS]
+    return " ".join(terms) if terms else normalized
+
+
+def _opposite(terms, other):
+    """
+    True if two key-term sets differ in negation, e.g. "currently employed"
+    and "currently unemployed", or "us citizen" and "not us citizen".
+    """
+    if (terms & NEGATION_WORDS) != (other & NEGATION_WORDS):
+        return True
+    for word in terms ^ other:
+        for prefix in NEGATION_PREFIXES:
+            if word.startswith(prefix) and word[len(prefix):] in (terms | other):
+                return True
+    return False
+
+
+def _vectorize(normalized):
+    """
+    Hashes the character n-grams of a question's key terms into a unit vector.
+    """
+    vec = np.zeros(VECTOR_DIM, dtype=np.float32)
+    padded = f" {_key_terms(normalized)} "
+    for i in range(len(padded) - NGRAM_SIZE + 1):
+        gram = padded[i:i + NGRAM_SIZE].encode("utf-8")
+        vec[zlib.crc32(gram) % VECTOR_DIM] += 1.0
+    norm = np.linalg.norm(vec)
+    if norm:
+        vec /= norm
+    return vec
+
+
+def profile_key(user_data):
+    """
+    Stable fingerprint of a candidate profile, ignoring run statistics.
+    """
+    profile = {k: v for k, v in (user_data or {}).items() if k not in VOLATILE_FIELDS}
+    raw = json.dumps(profile, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class _ProfileIndex:
+    """
+    Vectors and answers for one profile and question type, kept in a pre-allocated matrix so a
+    lookup is a single matrix-vector product.
+    Yes/no questions only match on the exact same key terms: one changed word
+    ("India" / "Indiana", "Remote" / "Onsite") is a different question.
+    """
+
+    def __init__(self, exact=False):
+        self.exact = exact
+        self.vectors = np.zeros((64, VECTOR_DIM), dtype=np.float32)
+        self.questions = []
+        self.terms = []
+        self.answers = []
+        self.positions = {}
+        self.by_terms = {}
+
+    def add(self, normalized, answer):
+        if normalized in self.positions:
+            row = self.positions[normalized]
+            self.answers[row] = answer
+            self.by_terms[self.terms[row]] = row
+            return
+
+        row = len(self.questions)
+        if row == len(self.vectors):
+            grown = np.zeros((row * 2, VECTOR_DIM), dtype=np.float32)
+            grown[:row] = self.vectors
+            self.vectors = grown
+
+        terms = frozenset(_key_terms(normalized).split())
+        self.vectors[row] = _vectorize(normalized)
+        self.questions.append(normalized)
+        self.terms.append(terms)
+        self.answers.append(answer)
+        self.positions[normalized] = row
+        self.by_terms[terms] = row
+
+    def search(self, normalized, threshold):
+        if normalized in self.positions:
+            return self.answers[self.positions[normalized]]
+
+        terms = frozenset(_key_terms(normalized).split())
+        if self.exact:
+            row = self.by_terms.get(terms)
+            return None if row is None else self.answers[row]
+
+        count = len(self.questions)
+        if not count:
+            return None
+
+        scores = self.vectors[:count] @ _vectorize(normalized)
+        best = int(np.argmax(scores))
+        if scores[best] >= threshold and not _opposite(terms, self.terms[best]):
+            return self.answers[best]
+        return None
+
+
+class AnswerCache:
+    """
+    Local index of previously answered screening questions.
+    """
+
+    def __init__(self, path=CACHE_FILE, threshold=SIMILARITY_THRESHOLD):
+        self.path = path
+        self.threshold = threshold
+        self.indexes = {}
+        self.lock = threading.Lock()
+        self.loaded = False
+
+    def _index(self, key):
+        if key not in self.indexes:
+            self.indexes[key] = _ProfileIndex(exact=key[1] == "yes_no")
+        return self.indexes[key]
+
+    def _load(self):
+        self.loaded = True
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                qtype = entry.get("type") or _question_type(entry["question"])
+                self._index((entry["profile"], qtype)).add(entry["question"], entry["answer"])
+
+    def lookup(self, question, user_data):
+        """
+        Returns the stored answer for a near-duplicate question, or None.
+        """
+        normalized, qtype = _parse(question)
+        if not normalized:
+            return None
+        with self.lock:
+            if not self.loaded:
+                self._load()
+            index = self.indexes.get((profile_key(user_data), qtype))
+            if index is None:
+                return None
+            return index.search(normalized, self.threshold)
+
+    def store(self, question, user_data, answer):
+        """
+        Remembers an answer. A later answer to the same question replaces it.
+        """
+        normalized, qtype = _parse(question)
+        if not normalized or not answer:
+            return
+        profile = profile_key(user_data)
+        with self.lock:
+            if not self.loaded:
+                self._load()
+            self._index((profile, qtype)).add(normalized, answer)
+            try:
+                with open(self.path, "a") as f:
+                    f.write(json.dumps({"profile": profile, "question": normalized, "type": qtype, "answer": answer}) + "\n")
+            except OSError as e:
+                print(f"⚠️ Could not persist answer cache: {e}")
+
+
+answer_cache = AnswerCache()
@@ -0,0 +1,50 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from backend_parser import get_ai_answer, get_ai_select_choice
+
+# Concurrent OpenAI requests per bot run
+MAX_AI_WORKERS = 8
+
+
+class AnswerPipeline:
+    """
+    Issues AI answer requests in the background so the browser can keep
+    working while they are in flight. Each request is made once per run:
+    asking the same question again returns the same pending answer.
+    """
+
+    def __init__(self, user_data, max_workers=MAX_AI_WORKERS):
+        self.user_data = user_data
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ai-answer")
+        self.requests = {}
+
+    def _submit(self, key, fn, *args):
+        future = self.requests.get(key)
+        # Empty answers mean the request failed, so ask again
+        if future is None or (future.done() and not future.result()):
+            future = self.executor.submit(fn, *args)
+            self.requests[key] = future
+        return future
+
+    def answer(self, question):
+        """
+        Starts (or reuses) a free-text answer request. Returns a Future.
+        """
+        return self._submit(("answer", question), get_ai_answer, question, self.user_data)
+
+    def correct(self, question, answer):
+        """
+        Replaces the run's answer to a question after the form rejected it,
+        so later cards with the same question use the corrected answer.
+        """
+        future = Future()
+        future.set_result(answer)
+        self.requests[("answer", question)] = future
+
+    def choice(self, question, options):
+        """
+        Starts (or reuses) a request to pick one of the options. Returns a Future.
+        """
+        return self._submit(("choice", question, tuple(options)), get_ai_select_choice, question, options, self.user_data)
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -11,6 +11,7 @@ os.environ['REQUESTS_CA_BUNDLE'] = certifi.where()
 
 from backend_parser import extract_text_from_pdf, analyze_resume_with_openai
 from apply_bot import run_application_bot
+from bulk_ingest import ingest_resumes
 from linkedin_bot import run_linkedin_bot
 from logger import clear_logs, log
 
@@ -29,8 +30,14 @@ def health():
 def index():
     return send_from_directory('.', 'index.html')
 
+# Only the site's own pages and assets are public. Everything else in the app
+# folder (user_data.json, checkpoints/, candidates/, dotfiles, source) is not.
+PUBLIC_EXTENSIONS = {'.html', '.css', '.js', '.jpeg', '.jpg', '.png', '.svg', '.ico'}
+
 @app.route('/<path:path>')
 def serve_static(path):
+    if '/' in path or path.startswith('.') or os.path.splitext(path)[1].lower() not in PUBLIC_EXTENSIONS:
+        return jsonify({"error": "Not found"}), 404
     return send_from_directory('.', path)
 
 # 2. Handle the Upload
@@ -88,6 +95,21 @@ def upload_resume():
             #     os.remove(resume_path)
             return jsonify({"error": str(e)}), 500
 
+# 2b. Bulk Upload (zip archives and/or many PDFs, one profile per candidate)
+@app.route('/api/bulk-upload', methods=['POST'])
+def bulk_upload():
+    files = request.files.getlist('resumes')
+    if not files or all(f.filename == '' for f in files):
+        return jsonify({"error": "No files uploaded"}), 400
+
+    try:
+        return jsonify(ingest_resumes(files))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        log(f"❌ Bulk upload error: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+
 # 3. Trigger Auto-Apply Bot
 @app.route('/api/auto-apply', methods=['POST'])
 def auto_apply():
@@ -4,9 +4,9 @@ import time
 import traceback
 import platform
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
+from form_schema import fill_form, submit_form
 from logger import log
 
 def save_history(entry):
@@ -83,28 +83,14 @@ def run_application_bot():
         time.sleep(1) # Wait for load
 
         # 4. Fill the Form
+        # The form's schema is learned on the first visit and replayed afterwards
         log("📝 Filling application form...")
-        
-        # Name
-        driver.find_element(By.ID, "fullname").send_keys(user_data.get('name', ''))
-        
-        # Email
-        driver.find_element(By.ID, "email").send_keys(user_data.get('email', ''))
-        
-        # Phone
-        driver.find_element(By.ID, "phone").send_keys(user_data.get('phone', ''))
-        
-        # Cover Letter (Using the summary from AI)
-        driver.find_element(By.ID, "cover_letter").send_keys(user_data.get('summary', ''))
-        
-        # File Upload
-        driver.find_element(By.ID, "resume").send_keys(resume_path)
-        
-        time.sleep(2) # Pause so you can see it happening
+        fill_form(driver, user_data, resume_path)
 
         # 5. Submit
         log("🚀 Submitting application...")
-        driver.find_element(By.TAG_NAME, "button").click()
+        if not submit_form(driver):
+            raise Exception("No submit button found on the application form")
         
         time.sleep(3) # Wait to see success message
         log("✅ Application successful!")
@@ -3,6 +3,8 @@ import json
 import PyPDF2
 from dotenv import load_dotenv
 from openai import OpenAI
+from answer_cache import answer_cache
+from resume_extractor import RESUME_FIELDS, extract_resume_fields
 
 # Load environment variables
 load_dotenv()
@@ -32,32 +34,52 @@ def extract_text_from_pdf(pdf_path):
     
     return text
 
+# Field descriptions for the AI, used only for fields the local pass missed
+AI_FIELD_PROMPTS = {
+    "name": "name (string)",
+    "email": "email (string)",
+    "phone": "phone (string)",
+    "skills": "skills (list of technical skills)",
+    "years_of_experience": "years_of_experience (int)",
+    "job_role": "job_role (inferred target title)",
+    "tech_stack": "tech_stack (list of frameworks/tools)",
+    "education": "education (list of strings, e.g. \"Degree - University\")",
+    "certifications": "certifications (list of strings)",
+    "summary": "summary (max 30 words)",
+}
+
+# These only need the top of the resume (header, summary, latest role),
+# so when nothing else is missing the AI gets a truncated resume
+HEADER_FIELDS = {"name", "job_role", "summary"}
+MAX_HEADER_CHARS = 3000
+
 def analyze_resume_with_openai(resume_text):
     """
-    Sends the resume text to OpenAI to extract structured data.
+    Extracts structured data from the resume text.
+    Contact details, skills, education and certifications are found locally;
+    OpenAI is only asked for the fields that pass could not fill.
     """
+    local_data = extract_resume_fields(resume_text)
+    missing = [field for field in RESUME_FIELDS if field not in local_data]
+
+    if not missing:
+        return {field: local_data[field] for field in RESUME_FIELDS}
+
     if not client:
         print("❌ Error: OpenAI client is not initialized (Missing API Key).")
-        return None
+        return local_data or None
 
     # Use gpt-4o-mini for production-grade cost efficiency (approx 30x cheaper than gpt-4o)
     model = "gpt-4o-mini"
 
+    fields = "\n".join(f"    - {AI_FIELD_PROMPTS[field]}" for field in missing)
+    only_header = set(missing) <= HEADER_FIELDS
+    resume_excerpt = resume_text[:MAX_HEADER_CHARS] if only_header else resume_text
     prompt = f"""
     You are an AI Recruiter. Extract structured data from this resume.
     
-    Return ONLY a valid JSON object. Be concise to save tokens.
-    Fields:
-    - name (string)
-    - email (string)
-    - phone (string)
-    - skills (list of technical skills)
-    - years_of_experience (int)
-    - job_role (inferred target title)
-    - tech_stack (list of frameworks/tools)
-    - education (list of strings, e.g. "Degree - University")
-    - certifications (list of strings)
-    - summary (max 30 words)
+    Return ONLY a valid JSON object with exactly these fields:
+{fields}
 
     Do not include markdown formatting, just the raw JSON object.
     """
@@ -67,22 +89,37 @@ def analyze_resume_with_openai(resume_text):
             model=model,
             response_format={"type": "json_object"}, # Enforces valid JSON
             temperature=0, # Deterministic output (better for data extraction)
-            max_tokens=500, # Hard limit to prevent runaway costs
+            max_tokens=150 if only_header else 500, # Hard limit to prevent runaway costs
             messages=[
                 {"role": "system", "content": prompt},
-                {"role": "user", "content": f"Here is the resume text:\n\n{resume_text}"}
+                {"role": "user", "content": f"Here is the resume text:\n\n{resume_excerpt}"}
             ]
         )
-        return json.loads(response.choices[0].message.content)
+        ai_data = json.loads(response.choices[0].message.content)
 
     except Exception as e:
         print(f"Error connecting to OpenAI: {e}")
-        return None
+        return local_data or None
+
+    # Locally extracted values win; the AI only fills the gaps
+    data = {}
+    for field in RESUME_FIELDS:
+        if field in local_data:
+            data[field] = local_data[field]
+        elif field in ai_data:
+            data[field] = ai_data[field]
+    return data
 
 def get_ai_answer(question, user_data, error_message=None):
     """
     Asks AI to answer a specific question based on user data.
+    Near-duplicate questions already answered for this profile are reused.
     """
+    if not error_message:
+        cached = answer_cache.lookup(question, user_data)
+        if cached:
+            return cached
+
     if not client:
         return ""
 
@@ -116,7 +153,10 @@ def get_ai_answer(question, user_data, error_message=None):
             max_tokens=50,
             temperature=0
         )
-        return response.choices[0].message.content.strip()
+        answer = response.choices[0].message.content.strip()
+        # A corrected answer overwrites the one the form rejected
+        answer_cache.store(question, user_data, answer)
+        return answer
     except:
         return ""
 
@@ -0,0 +1,222 @@
+import os
+import re
+import json
+import time
+import uuid
+import shutil
+import hashlib
+import zipfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from backend_parser import extract_text_from_pdf, analyze_resume_with_openai
+from logger import log
+
+# One JSON record per candidate, plus the uploaded PDFs of each batch
+CANDIDATES_DIR = "candidates"
+
+# Most resumes accepted in a single bulk request
+MAX_BULK_FILES = 1000
+
+# Size caps, checked against the zip directory before extracting anything
+MAX_RESUME_BYTES = 20 * 1024 * 1024
+MAX_BULK_BYTES = 1024 * 1024 * 1024
+
+# Concurrent OpenAI analyses. Keeps a big batch under the API rate limit.
+BULK_AI_CONCURRENCY = int(os.getenv("BULK_AI_CONCURRENCY", "8"))
+
+
+def _safe_name(filename):
+    # Drop any directory part (zip entries can contain "../") and odd characters
+    name = os.path.basename(filename.replace("\\", "/"))
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", name) or "resume.pdf"
+
+
+def _unique_path(directory, filename):
+    path = os.path.join(directory, _safe_name(filename))
+    stem, ext = os.path.splitext(path)
+    counter = 1
+    while os.path.exists(path):
+        path = f"{stem}_{counter}{ext}"
+        counter += 1
+    return path
+
+
+def _stream_size(stream):
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(0)
+    return size
+
+
+def _is_resume_member(member):
+    base = os.path.basename(member.filename)
+    return not (member.is_dir() or base.startswith(".") or "__MACOSX" in member.filename)
+
+
+def _check_batch_limits(files):
+    """
+    Counts the resumes and their uncompressed size from the zip directories
+    before anything is written, so an oversized batch never touches the disk.
+    """
+    count, total_bytes = 0, 0
+    for file in files:
+        name = (file.filename or "").lower()
+        if name.endswith(".zip"):
+            try:
+                with zipfile.ZipFile(file.stream) as archive:
+                    for member in archive.infolist():
+                        if not _is_resume_member(member) or not member.filename.lower().endswith(".pdf"):
+                            continue
+                        if member.file_size > MAX_RESUME_BYTES:
+                            raise ValueError(f"{member.filename} is larger than {MAX_RESUME_BYTES // (1024 * 1024)} MB")
+                        count += 1
+                        total_bytes += member.file_size
+            except zipfile.BadZipFile:
+                continue  # Reported per file when saving
+            finally:
+                file.stream.seek(0)
+        elif name.endswith(".pdf"):
+            size = _stream_size(file.stream)
+            if size > MAX_RESUME_BYTES:
+                raise ValueError(f"{file.filename} is larger than {MAX_RESUME_BYTES // (1024 * 1024)} MB")
+            count += 1
+            total_bytes += size
+
+    if count > MAX_BULK_FILES:
+        raise ValueError(f"Too many resumes in one batch ({count} > {MAX_BULK_FILES})")
+    if total_bytes > MAX_BULK_BYTES:
+        raise ValueError(f"Batch too large ({total_bytes // (1024 * 1024)} MB > {MAX_BULK_BYTES // (1024 * 1024)} MB uncompressed)")
+
+
+def save_uploads(files, upload_dir):
+    """
+    Saves uploaded PDFs and the PDFs inside uploaded zip archives.
+    Returns (saved paths, per-file errors for anything that was skipped).
+    """
+    os.makedirs(upload_dir, exist_ok=True)
+    paths, errors = [], []
+
+    for file in files:
+        name = file.filename or ""
+        if name.lower().endswith(".zip"):
+            try:
+                with zipfile.ZipFile(file.stream) as archive:
+                    for member in archive.infolist():
+                        if not _is_resume_member(member):
+                            continue
+                        if not member.filename.lower().endswith(".pdf"):
+                            errors.append({"file": member.filename, "status": "skipped", "error": "Not a PDF"})
+                            continue
+                        path = _unique_path(upload_dir, member.filename)
+                        # Reads stop at the size declared in the zip directory
+                        with archive.open(member) as src, open(path, 'wb') as dst:
+                            shutil.copyfileobj(src, dst)
+                        paths.append(path)
+            except zipfile.BadZipFile:
+                errors.append({"file": name, "status": "failed", "error": "Invalid zip archive"})
+        elif name.lower().endswith(".pdf"):
+            path = _unique_path(upload_dir, name)
+            file.save(path)
+            paths.append(path)
+        elif name:
+            errors.append({"file": name, "status": "skipped", "error": "Not a PDF"})
+
+    return paths, errors
+
+
+def _candidate_id(path, text):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    digest = hashlib.sha1(text.encode("utf-8")).hexdigest()[:8]
+    return f"{stem}-{digest}"
+
+
+def _analyze(path, text, batch_id):
+    if not text or not text.strip():
+        return {"file": os.path.basename(path), "status": "failed", "error": "Could not extract text"}
+    try:
+        data = analyze_resume_with_openai(text)
+    except Exception as e:
+        data = None
+        error = str(e)
+    else:
+        error = "AI returned no data"
+    if not data:
+        return {"file": os.path.basename(path), "status": "failed", "error": error}
+
+    candidate_id = _candidate_id(path, text)
+    data['application_count'] = 0
+    data['is_premium'] = False
+    data['source_file'] = os.path.basename(path)
+    data['batch_id'] = batch_id
+    with open(os.path.join(CANDIDATES_DIR, f"{candidate_id}.json"), 'w') as f:
+        json.dump(data, f, indent=4)
+
+    return {"file": os.path.basename(path), "status": "ok", "candidate_id": candidate_id, "name": data.get("name")}
+
+
+def _extract_text(path):
+    try:
+        return extract_text_from_pdf(path)
+    except Exception:
+        return None
+
+
+def _process_batch(paths, batch_id):
+    """
+    Parses PDFs in a process pool and hands each text to the AI pool as soon
+    as it is ready, so analysis starts with the first parsed resume instead
+    of after the last one. Results come back in the order of paths.
+    """
+    # Spawned, not forked: this runs inside a threaded request handler, and a
+    # forked child can inherit locks held by the server's other threads
+    context = multiprocessing.get_context("spawn")
+    workers = min(len(paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as parsers, \
+            ThreadPoolExecutor(max_workers=BULK_AI_CONCURRENCY) as analysts:
+        parsing = {parsers.submit(_extract_text, path): path for path in paths}
+        analyses = {}
+        for future in as_completed(parsing):
+            path = parsing[future]
+            # AI calls are network bound; the pool size caps requests in flight
+            analyses[path] = analysts.submit(_analyze, path, future.result(), batch_id)
+        return [analyses[path].result() for path in paths]
+
+
+def ingest_resumes(files):
+    """
+    Turns a batch of uploaded resumes into per-candidate profile records.
+    Text extraction runs in a process pool, the AI analyses in a bounded
+    thread pool fed as each text comes in, so a batch takes roughly
+    (N / concurrency) AI round trips.
+    """
+    started = time.time()
+    batch_id = time.strftime("%Y%m%d-%H%M%S-") + uuid.uuid4().hex[:6]
+    upload_dir = os.path.join(CANDIDATES_DIR, "uploads", batch_id)
+
+    _check_batch_limits(files)
+    try:
+        paths, results = save_uploads(files, upload_dir)
+    except Exception:
+        shutil.rmtree(upload_dir, ignore_errors=True)
+        raise
+
+    log(f"📦 Bulk ingest {batch_id}: {len(paths)} resumes")
+
+    if paths:
+        results.extend(_process_batch(paths, batch_id))
+
+    elapsed = time.time() - started
+    succeeded = sum(1 for r in results if r["status"] == "ok")
+    # Includes uploads that failed before parsing, such as a broken zip
+    failed = sum(1 for r in results if r["status"] == "failed")
+    log(f"✅ Bulk ingest {batch_id}: {succeeded}/{len(paths)} profiles in {elapsed:.1f}s")
+
+    return {
+        "batch_id": batch_id,
+        "total": len(paths),
+        "succeeded": succeeded,
+        "failed": failed,
+        "elapsed_seconds": round(elapsed, 2),
+        "resumes_per_minute": round(succeeded / elapsed * 60, 1) if elapsed else 0.0,
+        "results": results,
+    }
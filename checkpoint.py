@@ -0,0 +1,64 @@
+import os
+import json
+import time
+import hashlib
+
+# One checkpoint file per LinkedIn account
+CHECKPOINTS_DIR = "checkpoints"
+
+# A checkpoint older than the search window ("Past 24 hours") points at a
+# result list that no longer exists, so it is ignored.
+CHECKPOINT_MAX_AGE = 24 * 60 * 60
+
+
+def _checkpoint_path(email):
+    # Hash the email so account names don't show up on disk; the checkpoint
+    # itself doesn't store it either
+    user_id = hashlib.sha256(email.strip().lower().encode("utf-8")).hexdigest()
+    return os.path.join(CHECKPOINTS_DIR, f"{user_id}.json")
+
+
+def new_checkpoint(job_role):
+    return {
+        "job_role": job_role,
+        "search_page": 0,
+        "processed_job_ids": [],
+        "current_job_id": None,
+        "modal_step": None,
+        "attempts": {},
+        "updated_at": time.time(),
+    }
+
+
+def load_checkpoint(email, job_role):
+    """
+    Returns the saved checkpoint for this user and search, or a fresh one.
+    """
+    path = _checkpoint_path(email)
+    if os.path.exists(path):
+        try:
+            with open(path, 'r') as f:
+                checkpoint = json.load(f)
+            is_same_search = checkpoint.get("job_role") == job_role
+            is_recent = time.time() - checkpoint.get("updated_at", 0) < CHECKPOINT_MAX_AGE
+            if is_same_search and is_recent:
+                return checkpoint
+        except (json.JSONDecodeError, OSError):
+            pass
+    return new_checkpoint(job_role)
+
+
+def save_checkpoint(email, checkpoint):
+    checkpoint["updated_at"] = time.time()
+    os.makedirs(CHECKPOINTS_DIR, exist_ok=True)
+    path = _checkpoint_path(email)
+    with open(path + ".tmp", 'w') as f:
+        json.dump(checkpoint, f, indent=4)
+    # Atomic swap so a crash mid-write never leaves a truncated checkpoint
+    os.replace(path + ".tmp", path)
+
+
+def clear_checkpoint(email):
+    path = _checkpoint_path(email)
+    if os.path.exists(path):
+        os.remove(path)
@@ -0,0 +1,232 @@
+import os
+import re
+import json
+import hashlib
+from urllib.parse import urlparse
+from backend_parser import get_ai_select_choice
+from logger import log
+
+# Learned form layouts, keyed by "<domain>|<fingerprint>"
+SCHEMA_FILE = "form_schemas.json"
+
+# Profile fields a form input can be filled from. "resume" is the PDF itself.
+PROFILE_FIELDS = [
+    "name", "first_name", "last_name", "email", "phone", "summary", "skills",
+    "years_of_experience", "job_role", "tech_stack", "education",
+    "certifications", "resume",
+]
+
+# Keyword rules tried in order against an input's label, id, name and
+# placeholder, matched as whole words once punctuation and underscores are
+# turned into spaces. Only inputs none of these match are sent to the AI.
+FIELD_KEYWORDS = [
+    ("first_name", ("first name", "firstname", "given name")),
+    ("last_name", ("last name", "lastname", "surname", "family name")),
+    ("email", ("email", "e mail")),
+    ("phone", ("phone", "mobile", "contact number")),
+    ("summary", ("cover", "summary", "about you", "message")),
+    ("certifications", ("certifications?", "certificates?", "certified")),
+    ("education", ("education", "degree", "university", "college")),
+    ("tech_stack", ("stack", "frameworks?", "tools")),
+    ("skills", ("skills?",)),
+    ("years_of_experience", ("years", "experience")),
+    ("job_role", ("job title", "current title", "role", "position")),
+    # A bare "name" is too broad ("Company Name", "Referral name"); see
+    # _is_own_name_field for inputs labelled just "Name"
+    ("name", ("full name", "fullname", "your name", "candidate name", "applicant name")),
+]
+FIELD_PATTERNS = [
+    (profile_field, re.compile(r"\b(?:" + "|".join(keywords) + r")\b"))
+    for profile_field, keywords in FIELD_KEYWORDS
+]
+
+# Inputs whose state is not set through .value
+NON_TEXT_TYPES = {"checkbox", "radio", "range", "color"}
+
+# Shared by discovery and replay so both see the same inputs in the same order
+_FORM_INPUTS_JS = """
+    const form = document.querySelector('form') || document.body;
+    const inputs = Array.from(form.querySelectorAll('input, textarea, select')).filter(
+        el => !['hidden', 'submit', 'button', 'reset', 'image'].includes((el.type || '').toLowerCase())
+    );
+"""
+
+# One round trip: describe every input of the form
+_DESCRIBE_FORM_JS = _FORM_INPUTS_JS + """
+    return inputs.map(el => {
+        let label = '';
+        if (el.id) {
+            const l = document.querySelector('label[for="' + CSS.escape(el.id) + '"]');
+            if (l) label = l.innerText;
+        }
+        if (!label && el.closest('label')) label = el.closest('label').innerText;
+        return {
+            tag: el.tagName.toLowerCase(),
+            type: (el.type || '').toLowerCase(),
+            id: el.id || '',
+            name: el.name || '',
+            placeholder: el.placeholder || '',
+            label: label.trim(),
+        };
+    });
+"""
+
+# One round trip: fill every text input, return the file inputs for upload
+_FILL_FORM_JS = _FORM_INPUTS_JS + """
+    const values = arguments[0];
+    const files = [];
+    for (const [index, value] of Object.entries(values)) {
+        const el = inputs[Number(index)];
+        if (el.type === 'file') { files.push(el); continue; }
+        // .value means nothing on checkboxes, radios and dropdowns
+        if (el.tagName === 'SELECT' || el.type === 'checkbox' || el.type === 'radio') continue;
+        // React tracks the last value it set; assigning .value directly is
+        // invisible to it, so go through the native setter like a keypress would
+        const proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+    return files;
+"""
+
+_SUBMIT_FORM_JS = """
+    const form = document.querySelector('form') || document.body;
+    // querySelector with a selector list returns the first match in document
+    // order, so try the submit selectors first and plain buttons only after
+    const button = form.querySelector('button[type="submit"], input[type="submit"]')
+        || form.querySelector('button:not([type="button"]):not([type="reset"])');
+    if (button) { button.click(); return true; }
+    if (form.requestSubmit) { form.requestSubmit(); return true; }
+    return false;
+"""
+
+
+def _load_schemas():
+    if os.path.exists(SCHEMA_FILE):
+        try:
+            with open(SCHEMA_FILE, 'r') as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            pass
+    return {}
+
+
+def _save_schemas(schemas):
+    with open(SCHEMA_FILE, 'w') as f:
+        json.dump(schemas, f, indent=4)
+
+
+def fingerprint_form(fields):
+    """
+    Hash of the form's structure (tags, types, ids, names), ignoring label text.
+    """
+    structure = [[f["tag"], f["type"], f["id"], f["name"]] for f in fields]
+    return hashlib.sha1(json.dumps(structure).encode("utf-8")).hexdigest()[:16]
+
+
+def _portal_domain(url):
+    parsed = urlparse(url)
+    return parsed.netloc or parsed.scheme
+
+
+def _words(text):
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text.lower()).split())
+
+
+def _is_own_name_field(field):
+    # Judged on the most descriptive text only: id="name" with the label
+    # "Company Name" is still the company
+    text = field["label"] or field["placeholder"] or field["name"] or field["id"]
+    return _words(text) == "name"
+
+
+def _match_profile_field(field):
+    # Only text-like inputs and file uploads can be filled from the profile
+    if field["tag"] == "select" or field["type"] in NON_TEXT_TYPES:
+        return None
+    if field["type"] == "file":
+        return "resume"
+    if field["type"] == "email":
+        return "email"
+    if field["type"] == "tel":
+        return "phone"
+
+    text = _words(" ".join([field["label"], field["id"], field["name"], field["placeholder"]]))
+    for profile_field, pattern in FIELD_PATTERNS:
+        if pattern.search(text):
+            return profile_field
+    if _is_own_name_field(field):
+        return "name"
+
+    # Unknown input: let the AI map it once, the result is stored in the schema.
+    # "none" goes first so a missing API key never maps it to a real field.
+    question = field["label"] or field["placeholder"] or field["name"] or field["id"]
+    if not question:
+        return None
+    choice = get_ai_select_choice(question, ["none"] + PROFILE_FIELDS, {})
+    return choice if choice in PROFILE_FIELDS else None
+
+
+def discover_schema(domain, fingerprint, fields):
+    """
+    Maps each form input to a profile field.
+    """
+    mapping = {}
+    for index, field in enumerate(fields):
+        profile_field = _match_profile_field(field)
+        if profile_field:
+            mapping[str(index)] = profile_field
+    return {"domain": domain, "fingerprint": fingerprint, "fields": mapping}
+
+
+def get_profile_value(user_data, profile_field, resume_path):
+    if profile_field == "resume":
+        return resume_path
+    name_parts = (user_data.get("name") or "").split()
+    if profile_field == "first_name":
+        return name_parts[0] if name_parts else ""
+    if profile_field == "last_name":
+        return " ".join(name_parts[1:])
+
+    value = user_data.get(profile_field, "")
+    if isinstance(value, list):
+        return ", ".join(str(v) for v in value)
+    return "" if value is None else str(value)
+
+
+def fill_form(driver, user_data, resume_path):
+    """
+    Fills the form on the current page.
+    The first visit to a form learns its schema; later visits replay it
+    without any AI calls. A changed form structure is learned again.
+    """
+    fields = driver.execute_script(_DESCRIBE_FORM_JS)
+    domain = _portal_domain(driver.current_url)
+    fingerprint = fingerprint_form(fields)
+    key = f"{domain}|{fingerprint}"
+
+    schemas = _load_schemas()
+    schema = schemas.get(key)
+    if schema:
+        log(f"📐 Replaying saved form schema for {domain}")
+    else:
+        log(f"🧭 New form on {domain}, learning its schema...")
+        schema = discover_schema(domain, fingerprint, fields)
+        schemas[key] = schema
+        _save_schemas(schemas)
+
+    values = {}
+    for index, profile_field in schema["fields"].items():
+        value = get_profile_value(user_data, profile_field, resume_path)
+        if value:
+            values[index] = value
+
+    file_inputs = driver.execute_script(_FILL_FORM_JS, values)
+    # Browsers only accept file paths typed through WebDriver
+    for inp in file_inputs:
+        inp.send_keys(resume_path)
+
+
+def submit_form(driver):
+    return driver.execute_script(_SUBMIT_FORM_JS)
@@ -9,32 +9,57 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import WebDriverException, NoSuchWindowException, InvalidSessionIdException
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import Select
-from backend_parser import get_ai_answer, get_ai_select_choice
+from backend_parser import get_ai_answer
+from answer_pipeline import AnswerPipeline
+from answer_cache import CHECKBOX_QUESTION
+from checkpoint import load_checkpoint, save_checkpoint, clear_checkpoint
+from session_store import has_session, load_session, save_session, clear_session
 from logger import log
 
-def run_linkedin_bot(email, password):
-    log("🚀 LinkedIn Bot: Starting execution...")
-    # 1. Load User Data (for search keywords)
-    if not os.path.exists('user_data.json'):
-        raise Exception("No user data found. Please upload resume first.")
+# How many times a run restarts the browser after it crashes
+MAX_BROWSER_RESTARTS = 3
 
-    with open('user_data.json', 'r') as f:
-        user_data = json.load(f)
-    
-    # Resolve resume path for upload
-    resume_path = os.path.abspath("latest_resume.pdf")
-    if not os.path.exists(resume_path):
-        log("⚠️ Resume file not found. Upload logic will be skipped.")
+# How many times a job is retried when the browser dies while applying to it
+MAX_JOB_ATTEMPTS = 2
 
-    job_role = user_data.get('job_role', 'Software Engineer')
-    # location = "Remote" # Optional: You can hardcode or extract this too
+# Result pages to walk per batch (LinkedIn shows 25 jobs per page)
+MAX_SEARCH_PAGES = 1
+JOBS_PER_PAGE = 25
+
+# How long the saved-session probe waits for the logged-in navbar
+SESSION_PROBE_TIMEOUT = 8
+
+# Longest the browser waits for one AI answer before skipping the field
+AI_ANSWER_TIMEOUT = 30
+
+# Error fragments chromedriver reports when the browser itself is gone
+BROWSER_CRASH_MARKERS = (
+    "target window already closed",
+    "no such window",
+    "invalid session id",
+    "session deleted",
+    "chrome not reachable",
+    "disconnected",
+    "tab crashed",
+)
+
+
+def is_browser_crash(error):
+    """
+    True if the error means the browser or driver died, not just the page.
+    """
+    if isinstance(error, (NoSuchWindowException, InvalidSessionIdException)):
+        return True
+    if isinstance(error, WebDriverException):
+        message = str(error).lower()
+        return any(marker in message for marker in BROWSER_CRASH_MARKERS)
+    return False
 
-    log(f"🤖 LinkedIn Agent Initialized for: {email}")
-    log(f"🎯 Target Role: {job_role}")
 
-    # 2. Setup Chrome
+def create_driver():
     options = webdriver.ChromeOptions()
     options.add_argument("--start-maximized")
     options.add_argument("--disable-blink-features=AutomationControlled") # Anti-detection
@@ -51,29 +76,298 @@ def run_linkedin_bot(email, password):
         options.add_argument("--window-size=1920,1080")
     # -----------------------------------------------------------
 
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-    wait = WebDriverWait(driver, 60) # Increased wait for manual Captcha solving
+    return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
 
+
+def restore_session(driver, email):
+    """
+    Restores the user's saved cookies and checks they still log us in.
+    """
+    if not has_session(email):
+        return False
+
+    # Cookies can only be set on the site they belong to
+    driver.get("https://www.linkedin.com/")
+    if not load_session(driver, email):
+        return False
+
+    # Cheap probe: an authenticated page either shows the navbar or bounces to login
+    driver.get("https://www.linkedin.com/feed/")
     try:
-        # 3. Login
-        log("🔑 Logging in...")
-        driver.get("https://www.linkedin.com/login")
+        WebDriverWait(driver, SESSION_PROBE_TIMEOUT).until(EC.presence_of_element_located((By.ID, "global-nav")))
+    except WebDriverException as e:
+        if is_browser_crash(e):
+            raise
+        log("⌛ Saved session expired, logging in again")
+        clear_session(email)
+        return False
+    return True
+
+
+def login(driver, wait, email, password):
+    if restore_session(driver, email):
+        log("✅ Reused saved session, skipping login")
+        return
+
+    log("🔑 Logging in...")
+    driver.get("https://www.linkedin.com/login")
+    
+    driver.find_element(By.ID, "username").send_keys(email)
+    time.sleep(1)
+    driver.find_element(By.ID, "password").send_keys(password)
+    time.sleep(1)
+    driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+
+    # Wait for login to complete (check for navbar)
+    log("⏳ Waiting for login... (Please solve Captcha manually if it appears)")
+    wait.until(EC.presence_of_element_located((By.ID, "global-nav")))
+    log("✅ Login Successful")
+    save_session(driver, email)
+
+
+def get_job_id(card, page, index):
+    """
+    LinkedIn tags each card with its job ID. Fall back to the card position.
+    """
+    for attribute in ("data-job-id", "data-occludable-job-id"):
+        job_id = card.get_attribute(attribute)
+        if job_id:
+            return job_id
+    return f"page{page}-card{index}"
+
+
+def fill_application_modal(driver, user_data, resume_path, email, checkpoint, pipeline):
+    # 6. Handle the Application Modal (Multi-step Loop)
+    max_steps = 5
+    for step in range(max_steps):
+        checkpoint["modal_step"] = step
+        save_checkpoint(email, checkpoint)
+
+        # A. Resume Upload (Crucial Step)
+        # Done first: the modal re-renders after an upload, which would leave
+        # stale references to any fields discovered before it.
+        if os.path.exists(resume_path):
+            file_inputs = driver.find_elements(By.CSS_SELECTOR, "input[type='file']")
+            for inp in file_inputs:
+                try:
+                    inp.send_keys(resume_path)
+                    log("      📂 Resume uploaded")
+                except:
+                    pass
+
+        # B. Discover every field on this step and start all AI requests at once.
+        # The answers are generated while the browser fills the earlier fields.
+
+        # Text Inputs
+        text_fields = []
+        text_inputs = driver.find_elements(By.CSS_SELECTOR, "input[type='text'], textarea, input[type='tel'], input[type='email'], input[type='number']")
+        for inp in text_inputs:
+            if inp.is_displayed() and not inp.get_attribute("value"):
+                try:
+                    input_id = inp.get_attribute("id")
+                    if input_id:
+                        labels = driver.find_elements(By.CSS_SELECTOR, f"label[for='{input_id}']")
+                        if labels:
+                            label_text = labels[0].text
+                            text_fields.append((inp, label_text, pipeline.answer(label_text)))
+                except:
+                    pass
+
+        # Select/Dropdowns
+        select_fields = []
+        select_inputs = driver.find_elements(By.TAG_NAME, "select")
+        for select in select_inputs:
+            if select.is_displayed():
+                try:
+                    input_id = select.get_attribute("id")
+                    if input_id:
+                        labels = driver.find_elements(By.CSS_SELECTOR, f"label[for='{input_id}']")
+                        if labels:
+                            label_text = labels[0].text
+                            
+                            # Get options
+                            sel_obj = Select(select)
+                            options = [opt.text for opt in sel_obj.options if opt.text.strip()]
+                            
+                            if options:
+                                select_fields.append((sel_obj, options, pipeline.choice(label_text, options)))
+                except:
+                    pass
+
+        # Radio Buttons
+        radio_fields = []
+        fieldsets = driver.find_elements(By.TAG_NAME, "fieldset")
+        for fieldset in fieldsets:
+            try:
+                # Check if any radio in this fieldset is already selected
+                radios = fieldset.find_elements(By.CSS_SELECTOR, "input[type='radio']")
+                if any(r.is_selected() for r in radios):
+                    continue # Already answered
+
+                legend = fieldset.find_element(By.TAG_NAME, "legend").text
+                
+                # Get labels for radios and map text to the clickable element
+                options_map = {}
+                labels = fieldset.find_elements(By.TAG_NAME, "label")
+                for label in labels:
+                    text = label.text.strip()
+                    if text:
+                        options_map[text] = label
+                
+                if options_map:
+                    radio_fields.append((options_map, pipeline.choice(legend, list(options_map.keys()))))
+            except:
+                pass
+
+        # Checkboxes
+        checkbox_fields = []
+        checkboxes = driver.find_elements(By.CSS_SELECTOR, "input[type='checkbox']")
+        for cb in checkboxes:
+            if cb.is_displayed() and not cb.is_selected():
+                try:
+                    input_id = cb.get_attribute("id")
+                    if input_id:
+                        labels = driver.find_elements(By.CSS_SELECTOR, f"label[for='{input_id}']")
+                        if labels:
+                            label_text = labels[0].text
+                            # Ask AI if we should check it (Defaulting to Yes/True for completion)
+                            question = CHECKBOX_QUESTION.format(label_text)
+                            checkbox_fields.append((cb, pipeline.answer(question)))
+                except:
+                    pass
+
+        # C. Fill Text Inputs as their answers arrive
+        for inp, label_text, future in text_fields:
+            try:
+                answer = future.result(timeout=AI_ANSWER_TIMEOUT)
+                if answer:
+                    inp.send_keys(answer)
+                    inp.send_keys(Keys.TAB) # Trigger validation
+                    time.sleep(0.5)
+                    
+                    # Check for validation error (aria-invalid="true")
+                    if inp.get_attribute("aria-invalid") == "true":
+                        error_msg = "Invalid format"
+                        try:
+                            # Try to find the error message text (LinkedIn standard class)
+                            parent = inp.find_element(By.XPATH, "./..")
+                            err_elem = parent.find_element(By.CSS_SELECTOR, ".artdeco-inline-feedback__message")
+                            error_msg = err_elem.text
+                        except:
+                            pass
+                        
+                        log(f"      ⚠️ Validation Error: '{error_msg}'. Retrying with AI...")
+                        corrected = get_ai_answer(label_text, user_data, error_message=error_msg)
+                        if corrected:
+                            pipeline.correct(label_text, corrected)
+                            inp.clear()
+                            inp.send_keys(corrected)
+                            inp.send_keys(Keys.TAB)
+                            time.sleep(0.5)
+            except:
+                pass
+
+        # D. Fill Select/Dropdowns
+        for sel_obj, options, future in select_fields:
+            try:
+                choice = future.result(timeout=AI_ANSWER_TIMEOUT)
+                if choice:
+                    try:
+                        sel_obj.select_by_visible_text(choice)
+                    except:
+                        # Fuzzy match fallback
+                        for opt in options:
+                            if choice.lower() in opt.lower():
+                                sel_obj.select_by_visible_text(opt)
+                                break
+                time.sleep(0.5)
+            except:
+                pass
+
+        # E. Click Radio Buttons
+        for options_map, future in radio_fields:
+            try:
+                choice = future.result(timeout=AI_ANSWER_TIMEOUT)
+                if choice in options_map:
+                    # Use JS click for reliability on custom radio UIs
+                    driver.execute_script("arguments[0].click();", options_map[choice])
+                    time.sleep(0.5)
+            except:
+                pass
+
+        # F. Tick Checkboxes
+        for cb, future in checkbox_fields:
+            try:
+                answer = future.result(timeout=AI_ANSWER_TIMEOUT)
+                if "yes" in answer.lower():
+                    driver.execute_script("arguments[0].click();", cb)
+                    time.sleep(0.5)
+            except:
+                pass
+
+        # G. Check for Submit Button
+        submit_btn = driver.find_elements(By.CSS_SELECTOR, "button[aria-label='Submit application']")
+        if submit_btn:
+            log("      🚀 Submit button found! Applying...")
+            # Use JS click for submit as well
+            driver.execute_script("arguments[0].click();", submit_btn[0])
+            time.sleep(3)
+            # Close Success Modal
+            close_btn = driver.find_elements(By.CSS_SELECTOR, "button[aria-label='Dismiss']")
+            if close_btn: 
+                driver.execute_script("arguments[0].click();", close_btn[0])
+            log("      ✅ Application Sent!")
+            break
+        
+        # Increment Application Count
+        user_data['application_count'] = user_data.get('application_count', 0) + 1
+        with open('user_data.json', 'w') as f:
+            json.dump(user_data, f, indent=4)
+        
+        # H. Check for Next/Review Button
+        next_btn = driver.find_elements(By.CSS_SELECTOR, "button[aria-label='Continue to next step']")
+        if not next_btn:
+            next_btn = driver.find_elements(By.CSS_SELECTOR, "button[aria-label='Review your application']")
         
-        driver.find_element(By.ID, "username").send_keys(email)
-        time.sleep(1)
-        driver.find_element(By.ID, "password").send_keys(password)
-        time.sleep(1)
-        driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        if next_btn:
+            # Use JS click for next
+            driver.execute_script("arguments[0].click();", next_btn[0])
+            time.sleep(2)
+        else:
+            # Stuck or unknown state
+            break
+
+
+def run_batch(driver, wait, user_data, resume_path, job_role, email, checkpoint, pipeline):
+    """
+    Walks the search results from the checkpoint onwards.
+    Returns False if the search found no jobs at all.
+    """
+    processed = set(checkpoint["processed_job_ids"])
+
+    # A job the browser died on is retried, but not forever
+    interrupted = checkpoint.get("current_job_id")
+    if interrupted:
+        attempts = checkpoint["attempts"].get(interrupted, 0) + 1
+        checkpoint["attempts"][interrupted] = attempts
+        if attempts >= MAX_JOB_ATTEMPTS:
+            log(f"⏭️ Skipping job {interrupted}: browser crashed on it {attempts} times")
+            processed.add(interrupted)
+            checkpoint["processed_job_ids"].append(interrupted)
+        checkpoint["current_job_id"] = None
+        checkpoint["modal_step"] = None
+        save_checkpoint(email, checkpoint)
 
-        # Wait for login to complete (check for navbar)
-        log("⏳ Waiting for login... (Please solve Captcha manually if it appears)")
-        wait.until(EC.presence_of_element_located((By.ID, "global-nav")))
-        log("✅ Login Successful")
+    for page in range(checkpoint["search_page"], MAX_SEARCH_PAGES):
+        checkpoint["search_page"] = page
+        save_checkpoint(email, checkpoint)
 
         # 4. Search Jobs (Filtered by Easy Apply & Date Posted)
         # f_AL=true turns on "Easy Apply" filter
         # f_TPR=r86400 filters by "Past 24 hours" (Use r604800 for Past Week)
         search_url = f"https://www.linkedin.com/jobs/search/?keywords={job_role}&f_AL=true&f_TPR=r86400"
+        if page:
+            search_url += f"&start={page * JOBS_PER_PAGE}"
         driver.get(search_url)
         log(f"🔎 Searching: {search_url}")
         time.sleep(3)
@@ -83,16 +377,23 @@ def run_linkedin_bot(email, password):
         job_cards = driver.find_elements(By.CSS_SELECTOR, ".job-card-container")
         
         if not job_cards:
-            log("⚠️ No jobs found on page 1. Try broadening your search (remove 'Past 24h' filter).")
-            return
+            if page == 0 and not processed:
+                log("⚠️ No jobs found on page 1. Try broadening your search (remove 'Past 24h' filter).")
+                return False
+            break
 
-        log(f"👀 Found {len(job_cards)} potential jobs on page 1")
+        log(f"👀 Found {len(job_cards)} potential jobs on page {page + 1}")
 
         for i, card in enumerate(job_cards): # Removed limit to keep running
             # Check for Stop Signal
             if os.path.exists("stop_signal.txt"):
                 log("🛑 Stop signal received. Halting bot...")
-                break
+                return True
+
+            job_id = get_job_id(card, page, i)
+            if job_id in processed:
+                log(f"   ⏭️ Job {i+1} already processed in an earlier run, skipping")
+                continue
 
             # Check Payment Limits
             current_count = user_data.get('application_count', 0)
@@ -100,6 +401,10 @@ def run_linkedin_bot(email, password):
             if not is_premium and current_count >= 3:
                 raise Exception("PAYMENT_REQUIRED")
 
+            checkpoint["current_job_id"] = job_id
+            checkpoint["modal_step"] = None
+            save_checkpoint(email, checkpoint)
+
             try:
                 log(f"   👉 Processing Job {i+1}...")
                 card.click()
@@ -112,189 +417,94 @@ def run_linkedin_bot(email, password):
                 log("      Clicked Easy Apply")
                 time.sleep(2)
                 
-                # 6. Handle the Application Modal (Multi-step Loop)
-                max_steps = 5
-                for step in range(max_steps):
-                    # A. Resume Upload (Crucial Step)
-                    if os.path.exists(resume_path):
-                        file_inputs = driver.find_elements(By.CSS_SELECTOR, "input[type='file']")
-                        for inp in file_inputs:
-                            try:
-                                inp.send_keys(resume_path)
-                                log("      📂 Resume uploaded")
-                            except:
-                                pass
-
-                    # B. AI Form Filling (Text Inputs)
-                    text_inputs = driver.find_elements(By.CSS_SELECTOR, "input[type='text'], textarea, input[type='tel'], input[type='email'], input[type='number']")
-                    for inp in text_inputs:
-                        if inp.is_displayed() and not inp.get_attribute("value"):
-                            try:
-                                input_id = inp.get_attribute("id")
-                                if input_id:
-                                    labels = driver.find_elements(By.CSS_SELECTOR, f"label[for='{input_id}']")
-                                    if labels:
-                                        label_text = labels[0].text
-                                        answer = get_ai_answer(label_text, user_data)
-                                        if answer:
-                                            inp.send_keys(answer)
-                                            inp.send_keys(Keys.TAB) # Trigger validation
-                                            time.sleep(0.5)
-                                            
-                                            # Check for validation error (aria-invalid="true")
-                                            if inp.get_attribute("aria-invalid") == "true":
-                                                error_msg = "Invalid format"
-                                                try:
-                                                    # Try to find the error message text (LinkedIn standard class)
-                                                    parent = inp.find_element(By.XPATH, "./..")
-                                                    err_elem = parent.find_element(By.CSS_SELECTOR, ".artdeco-inline-feedback__message")
-                                                    error_msg = err_elem.text
-                                                except:
-                                                    pass
-                                                
-                                                log(f"      ⚠️ Validation Error: '{error_msg}'. Retrying with AI...")
-                                                corrected = get_ai_answer(label_text, user_data, error_message=error_msg)
-                                                if corrected:
-                                                    inp.clear()
-                                                    inp.send_keys(corrected)
-                                                    inp.send_keys(Keys.TAB)
-                                                    time.sleep(0.5)
-                            except:
-                                pass
-
-                    # C. AI Form Filling (Select/Dropdowns)
-                    select_inputs = driver.find_elements(By.TAG_NAME, "select")
-                    for select in select_inputs:
-                        if select.is_displayed():
-                            try:
-                                input_id = select.get_attribute("id")
-                                if input_id:
-                                    labels = driver.find_elements(By.CSS_SELECTOR, f"label[for='{input_id}']")
-                                    if labels:
-                                        label_text = labels[0].text
-                                        
-                                        # Get options
-                                        sel_obj = Select(select)
-                                        options = [opt.text for opt in sel_obj.options if opt.text.strip()]
-                                        
-                                        if options:
-                                            choice = get_ai_select_choice(label_text, options, user_data)
-                                            if choice:
-                                                try:
-                                                    sel_obj.select_by_visible_text(choice)
-                                                except:
-                                                    # Fuzzy match fallback
-                                                    for opt in options:
-                                                        if choice.lower() in opt.lower():
-                                                            sel_obj.select_by_visible_text(opt)
-                                                            break
-                                            time.sleep(0.5)
-                            except:
-                                pass
-
-                    # D. AI Form Filling (Radio Buttons)
-                    fieldsets = driver.find_elements(By.TAG_NAME, "fieldset")
-                    for fieldset in fieldsets:
-                        try:
-                            # Check if any radio in this fieldset is already selected
-                            radios = fieldset.find_elements(By.CSS_SELECTOR, "input[type='radio']")
-                            if any(r.is_selected() for r in radios):
-                                continue # Already answered
-
-                            legend = fieldset.find_element(By.TAG_NAME, "legend").text
-                            
-                            # Get labels for radios and map text to the clickable element
-                            options_map = {}
-                            labels = fieldset.find_elements(By.TAG_NAME, "label")
-                            for label in labels:
-                                text = label.text.strip()
-                                if text:
-                                    options_map[text] = label
-                            
-                            if options_map:
-                                options = list(options_map.keys())
-                                choice = get_ai_select_choice(legend, options, user_data)
-                                if choice in options_map:
-                                    # Use JS click for reliability on custom radio UIs
-                                    driver.execute_script("arguments[0].click();", options_map[choice])
-                                    time.sleep(0.5)
-                        except:
-                            pass
-
-                    # E. AI Form Filling (Checkboxes)
-                    checkboxes = driver.find_elements(By.CSS_SELECTOR, "input[type='checkbox']")
-                    for cb in checkboxes:
-                        if cb.is_displayed() and not cb.is_selected():
-                            try:
-                                input_id = cb.get_attribute("id")
-                                if input_id:
-                                    labels = driver.find_elements(By.CSS_SELECTOR, f"label[for='{input_id}']")
-                                    if labels:
-                                        label_text = labels[0].text
-                                        # Ask AI if we should check it (Defaulting to Yes/True for completion)
-                                        answer = get_ai_answer(f"Should I check the box for: '{label_text}'? Answer Yes or No.", user_data)
-                                        
-                                        if "yes" in answer.lower():
-                                            driver.execute_script("arguments[0].click();", cb)
-                                            time.sleep(0.5)
-                            except:
-                                pass
-
-                    # F. Check for Submit Button
-                    submit_btn = driver.find_elements(By.CSS_SELECTOR, "button[aria-label='Submit application']")
-                    if submit_btn:
-                        log("      🚀 Submit button found! Applying...")
-                        # Use JS click for submit as well
-                        driver.execute_script("arguments[0].click();", submit_btn[0])
-                        time.sleep(3)
-                        # Close Success Modal
-                        close_btn = driver.find_elements(By.CSS_SELECTOR, "button[aria-label='Dismiss']")
-                        if close_btn: 
-                            driver.execute_script("arguments[0].click();", close_btn[0])
-                        log("      ✅ Application Sent!")
-                        break
-                    
-                    # Increment Application Count
-                    user_data['application_count'] = user_data.get('application_count', 0) + 1
-                    with open('user_data.json', 'w') as f:
-                        json.dump(user_data, f, indent=4)
-                    
-                    # G. Check for Next/Review Button
-                    next_btn = driver.find_elements(By.CSS_SELECTOR, "button[aria-label='Continue to next step']")
-                    if not next_btn:
-                        next_btn = driver.find_elements(By.CSS_SELECTOR, "button[aria-label='Review your application']")
-                    
-                    if next_btn:
-                        # Use JS click for next
-                        driver.execute_script("arguments[0].click();", next_btn[0])
-                        time.sleep(2)
-                    else:
-                        # Stuck or unknown state
-                        break
+                fill_application_modal(driver, user_data, resume_path, email, checkpoint, pipeline)
 
             except Exception as e:
+                if is_browser_crash(e):
+                    raise
                 log(f"      ❌ Could not apply to this job: {str(e)[:50]}")
-                continue
+
+            processed.add(job_id)
+            checkpoint["processed_job_ids"].append(job_id)
+            checkpoint["current_job_id"] = None
+            checkpoint["modal_step"] = None
+            save_checkpoint(email, checkpoint)
             
             # Human-like delay between jobs (5 to 10 seconds)
             delay = random.uniform(5, 10)
             log(f"⏳ Waiting {delay:.1f}s before next job to avoid detection...")
             time.sleep(delay)
-        
-        log("🏁 Batch complete.")
-        
-        # Save a log for the history page
-        from apply_bot import save_history
-        save_history({
-            "company": "LinkedIn Network",
-            "role": job_role,
-            "status": "Batch Processed",
-            "date": time.strftime("%Y-%m-%d %H:%M:%S")
-        })
-
-    except Exception as e:
-        log(f"❌ Bot Error: {e}")
-        raise e
-    finally:
-        log("🛑 Closing Driver...")
-        driver.quit()
\ No newline at end of file
+
+    return True
+
+
+def run_linkedin_bot(email, password):
+    log("🚀 LinkedIn Bot: Starting execution...")
+    # 1. Load User Data (for search keywords)
+    if not os.path.exists('user_data.json'):
+        raise Exception("No user data found. Please upload resume first.")
+
+    with open('user_data.json', 'r') as f:
+        user_data = json.load(f)
+    
+    # Resolve resume path for upload
+    resume_path = os.path.abspath("latest_resume.pdf")
+    if not os.path.exists(resume_path):
+        log("⚠️ Resume file not found. Upload logic will be skipped.")
+
+    job_role = user_data.get('job_role', 'Software Engineer')
+    # location = "Remote" # Optional: You can hardcode or extract this too
+
+    log(f"🤖 LinkedIn Agent Initialized for: {email}")
+    log(f"🎯 Target Role: {job_role}")
+
+    # Pick up where a crashed run left off
+    checkpoint = load_checkpoint(email, job_role)
+    if checkpoint["processed_job_ids"] or checkpoint["current_job_id"]:
+        log(f"♻️ Resuming from checkpoint: page {checkpoint['search_page'] + 1}, {len(checkpoint['processed_job_ids'])} jobs already processed")
+
+    # AI answers are generated in the background while the browser works
+    pipeline = AnswerPipeline(user_data)
+
+    restarts = 0
+    while True:
+        # 2. Setup Chrome
+        driver = create_driver()
+        wait = WebDriverWait(driver, 60) # Increased wait for manual Captcha solving
+
+        try:
+            # 3. Login
+            login(driver, wait, email, password)
+            found_jobs = run_batch(driver, wait, user_data, resume_path, job_role, email, checkpoint, pipeline)
+            break
+
+        except Exception as e:
+            if is_browser_crash(e) and restarts < MAX_BROWSER_RESTARTS:
+                restarts += 1
+                log(f"💥 Browser crashed ({str(e).splitlines()[0][:80]}). Restarting ({restarts}/{MAX_BROWSER_RESTARTS})...")
+                continue
+            log(f"❌ Bot Error: {e}")
+            pipeline.close()
+            raise e
+        finally:
+            log("🛑 Closing Driver...")
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    pipeline.close()
+    clear_checkpoint(email)
+    if not found_jobs:
+        return
+
+    log("🏁 Batch complete.")
+    
+    # Save a log for the history page
+    from apply_bot import save_history
+    save_history({
+        "company": "LinkedIn Network",
+        "role": job_role,
+        "status": "Batch Processed",
+        "date": time.strftime("%Y-%m-%d %H:%M:%S")
+    })
@@ -0,0 +1,463 @@
+"""
+Offline load test for the Flask API.
+
+Starts app.py in a child process with OpenAI and the Selenium bots stubbed
+out, hammers its endpoints at a configurable concurrency and writes latency
+percentiles, throughput, error rates and server RSS to a JSON file.
+
+    python load_test.py --concurrency 16 --requests 500
+    python load_test.py --baseline load_test_results/previous.json
+"""
+import io
+import os
+import sys
+import json
+import time
+import uuid
+import shutil
+import socket
+import zipfile
+import argparse
+import platform
+import tempfile
+import threading
+import subprocess
+import urllib.request
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+
+RESULTS_DIR = "load_test_results"
+SCENARIOS = ["health", "static", "history", "upload", "bulk_upload", "auto_apply", "linkedin_apply", "stop_bot"]
+
+SAMPLE_RESUME_LINES = [
+    "Alex Morgan",
+    "alex.morgan@example.com | +1 415 555 0132",
+    "SUMMARY",
+    "Backend engineer with 5 years of experience building Python services.",
+    "SKILLS",
+    "Python, SQL, Git, Docker, Flask, React, AWS",
+    "EDUCATION",
+    "B.Tech in Computer Science - State University",
+    "CERTIFICATIONS",
+    "AWS Certified Developer",
+]
+
+
+# ---------------------------------------------------------------------------
+# Server side (runs in the child process)
+# ---------------------------------------------------------------------------
+
+class _FakeMessage:
+    def __init__(self, content):
+        self.content = content
+
+
+class _FakeChoice:
+    def __init__(self, content):
+        self.message = _FakeMessage(content)
+
+
+class _FakeResponse:
+    def __init__(self, content):
+        self.choices = [_FakeChoice(content)]
+
+
+class _FakeCompletions:
+    def __init__(self, latency):
+        self.latency = latency
+
+    def create(self, **kwargs):
+        time.sleep(self.latency)
+        if kwargs.get("response_format", {}).get("type") == "json_object":
+            return _FakeResponse(json.dumps({
+                "name": "Alex Morgan",
+                "job_role": "Backend Engineer",
+                "summary": "Backend engineer with 5 years of Python experience.",
+                "years_of_experience": 5,
+            }))
+        return _FakeResponse("Yes")
+
+
+class _FakeOpenAI:
+    def __init__(self, latency):
+        self.chat = type("Chat", (), {})()
+        self.chat.completions = _FakeCompletions(latency)
+
+
+def serve(args):
+    """
+    Runs app.py with the OpenAI client and both bots stubbed.
+    Working files (user_data.json, history, ...) live in args.workdir.
+    """
+    repo_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, repo_dir)
+    os.chdir(args.workdir)
+
+    import backend_parser
+    import app as app_module
+
+    backend_parser.client = _FakeOpenAI(args.llm_latency)
+
+    def fake_bot(*_args, **_kwargs):
+        time.sleep(args.bot_latency)
+
+    app_module.run_application_bot = fake_bot
+    app_module.run_linkedin_bot = fake_bot
+
+    from werkzeug.serving import make_server
+    server = make_server("127.0.0.1", args.port, app_module.app, threaded=True)
+    print(f"READY {args.port}", flush=True)
+    server.serve_forever()
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+def make_sample_pdf(lines):
+    """
+    Builds a one-page text PDF by hand, so the harness needs no PDF writer.
+    """
+    text_ops = ["BT", "/F1 11 Tf", "14 TL", "50 750 Td"]
+    for line in lines:
+        escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+        text_ops.append(f"({escaped}) Tj T*")
+    text_ops.append("ET")
+    stream = "\n".join(text_ops).encode("latin-1")
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        b"/Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n" + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref_at = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        pdf += f"{offset:010d} 00000 n \n".encode()
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_at}\n%%EOF\n".encode()
+    return bytes(pdf)
+
+
+def make_history(size):
+    return [
+        {
+            "company": f"Company {i}",
+            "role": "Software Engineer",
+            "status": "Applied" if i % 3 else "Batch Processed",
+            "date": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time() - i * 60)),
+        }
+        for i in range(size)
+    ]
+
+
+def prepare_workdir(workdir, history_size):
+    with open(os.path.join(workdir, "application_history.json"), "w") as f:
+        json.dump(make_history(history_size), f)
+    # Premium so the bot endpoints never stop at the payment limit
+    with open(os.path.join(workdir, "user_data.json"), "w") as f:
+        json.dump({"name": "Alex Morgan", "job_role": "Backend Engineer",
+                   "application_count": 0, "is_premium": True}, f)
+
+
+def make_resume_zip(pdf_bytes, count):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for i in range(count):
+            archive.writestr(f"resume_{i}.pdf", pdf_bytes)
+    return buffer.getvalue()
+
+
+def multipart_body(field, filename, content, content_type):
+    boundary = uuid.uuid4().hex
+    body = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode() + content + f"\r\n--{boundary}--\r\n".encode()
+    return body, f"multipart/form-data; boundary={boundary}"
+
+
+# ---------------------------------------------------------------------------
+# Client side
+# ---------------------------------------------------------------------------
+
+def build_requests(pdf_bytes, bulk_size):
+    """
+    Scenario name -> list of (method, path, body, headers) to cycle through.
+    """
+    upload_body, upload_type = multipart_body("resume", "resume.pdf", pdf_bytes, "application/pdf")
+    bulk_body, bulk_type = multipart_body("resumes", "resumes.zip", make_resume_zip(pdf_bytes, bulk_size), "application/zip")
+    creds = json.dumps({"email": "loadtest@example.com", "password": "secret"}).encode()
+    json_headers = {"Content-Type": "application/json"}
+    return {
+        "health": [("GET", "/health", None, {})],
+        "static": [("GET", "/", None, {}), ("GET", "/styles.css", None, {}),
+                   ("GET", "/script.js", None, {}), ("GET", "/dashboard.html", None, {})],
+        "history": [("GET", "/api/history", None, {})],
+        "upload": [("POST", "/api/upload", upload_body, {"Content-Type": upload_type})],
+        "bulk_upload": [("POST", "/api/bulk-upload", bulk_body, {"Content-Type": bulk_type})],
+        "auto_apply": [("POST", "/api/auto-apply", b"", {})],
+        "linkedin_apply": [("POST", "/api/linkedin-apply", creds, json_headers)],
+        "stop_bot": [("POST", "/api/stop-bot", b"", {})],
+    }
+
+
+def send(base_url, method, path, body, headers, timeout):
+    request = urllib.request.Request(base_url + path, data=body, method=method, headers=headers)
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        e.read()
+        status = e.code
+    except Exception as e:
+        status = type(e).__name__
+    return status, (time.perf_counter() - started) * 1000
+
+
+def read_rss_mb(pid):
+    try:
+        import psutil
+        return psutil.Process(pid).memory_info().rss / (1024 * 1024)
+    except ImportError:
+        pass
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+class RssSampler(threading.Thread):
+    def __init__(self, pid, interval=0.2):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.peak = None
+        self.running = True
+
+    def run(self):
+        while self.running:
+            rss = read_rss_mb(self.pid)
+            if rss is not None:
+                self.peak = max(self.peak or 0, rss)
+            time.sleep(self.interval)
+
+    def stop(self):
+        self.running = False
+        self.join()
+        return self.peak
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    # Nearest-rank percentile
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def run_scenario(base_url, name, requests_list, args, server_pid):
+    total = args.requests
+    rss_before = read_rss_mb(server_pid)
+    sampler = RssSampler(server_pid)
+    sampler.start()
+
+    def worker(i):
+        method, path, body, headers = requests_list[i % len(requests_list)]
+        return send(base_url, method, path, body, headers, args.timeout)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        outcomes = list(pool.map(worker, range(total)))
+    elapsed = time.perf_counter() - started
+    peak_rss = sampler.stop()
+
+    latencies = sorted(latency for _, latency in outcomes)
+    statuses = {}
+    for status, _ in outcomes:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    errors = sum(count for status, count in statuses.items() if not status.isdigit() or int(status) >= 400)
+
+    def ms(value):
+        return round(value, 2) if value is not None else None
+
+    return {
+        "requests": total,
+        "concurrency": args.concurrency,
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 2) if elapsed else None,
+        "errors": errors,
+        "error_rate": round(errors / total, 4) if total else 0.0,
+        "status_codes": statuses,
+        "latency_ms": {
+            "mean": ms(sum(latencies) / len(latencies)) if latencies else None,
+            "p50": ms(percentile(latencies, 50)),
+            "p95": ms(percentile(latencies, 95)),
+            "p99": ms(percentile(latencies, 99)),
+            "max": ms(latencies[-1]) if latencies else None,
+        },
+        "server_rss_mb": {
+            "before": ms(rss_before),
+            "peak": ms(peak_rss),
+            "after": ms(read_rss_mb(server_pid)),
+        },
+    }
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except Exception:
+        return None
+
+
+def start_server(args, workdir, port):
+    command = [sys.executable, os.path.abspath(__file__), "--serve", "--port", str(port),
+               "--workdir", workdir, "--llm-latency", str(args.llm_latency),
+               "--bot-latency", str(args.bot_latency)]
+    env = dict(os.environ, OPENAI_API_KEY="load-test")
+    server = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, env=env)
+
+    deadline = time.time() + 30
+    for line in server.stdout:
+        if line.startswith("READY"):
+            break
+        if time.time() > deadline:
+            break
+    # The app prints debug output on stdout; keep draining it so it never blocks
+    threading.Thread(target=lambda: [None for _ in server.stdout], daemon=True).start()
+
+    while time.time() < deadline:
+        status, _ = send(f"http://127.0.0.1:{port}", "GET", "/health", None, {}, 2)
+        if status == 200:
+            return server
+        time.sleep(0.1)
+    server.kill()
+    raise RuntimeError("Server did not start")
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"\n📊 Compared with {baseline_path} ({baseline.get('git_revision')})")
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            continue
+        for metric in ("p50", "p95", "p99"):
+            old, new = previous["latency_ms"][metric], current["latency_ms"][metric]
+            if old and new:
+                change = (new - old) / old * 100
+                flag = "⚠️ " if change > 20 else "   "
+                print(f"{flag}{name:15} {metric}: {old:8.2f} -> {new:8.2f} ms ({change:+.0f}%)")
+        old_rps, new_rps = previous.get("throughput_rps"), current.get("throughput_rps")
+        if old_rps and new_rps:
+            print(f"   {name:15} rps: {old_rps:8.2f} -> {new_rps:8.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline load test for the JobPilot API")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS),
+                        help=f"Comma-separated subset of: {', '.join(SCENARIOS)}")
+    parser.add_argument("--history-size", type=int, default=20000, help="Entries in the synthetic history file")
+    parser.add_argument("--bulk-size", type=int, default=10, help="Resumes per zip in the bulk_upload scenario")
+    parser.add_argument("--pdf", help="Resume PDF to upload (default: generated sample)")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Seconds per stubbed OpenAI call")
+    parser.add_argument("--bot-latency", type=float, default=0.05, help="Seconds per stubbed bot run")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--output", help="Result file (default: load_test_results/<timestamp>.json)")
+    parser.add_argument("--baseline", help="Earlier result file to compare against")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=0, help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args)
+        return
+
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = [s for s in scenarios if s not in SCENARIOS]
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(unknown)}")
+
+    if args.pdf:
+        with open(args.pdf, "rb") as f:
+            pdf_bytes = f.read()
+    else:
+        pdf_bytes = make_sample_pdf(SAMPLE_RESUME_LINES)
+
+    workdir = tempfile.mkdtemp(prefix="jobpilot-loadtest-")
+    prepare_workdir(workdir, args.history_size)
+    port = free_port()
+
+    print(f"🚀 Starting stubbed server on port {port} (workdir {workdir})")
+    server = start_server(args, workdir, port)
+    base_url = f"http://127.0.0.1:{port}"
+    requests_by_scenario = build_requests(pdf_bytes, args.bulk_size)
+
+    results = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "config": {
+            "concurrency": args.concurrency,
+            "requests_per_scenario": args.requests,
+            "history_size": args.history_size,
+            "bulk_size": args.bulk_size,
+            "llm_latency": args.llm_latency,
+            "bot_latency": args.bot_latency,
+        },
+        "scenarios": {},
+    }
+
+    try:
+        for name in scenarios:
+            print(f"   👉 {name}...", flush=True)
+            summary = run_scenario(base_url, name, requests_by_scenario[name], args, server.pid)
+            results["scenarios"][name] = summary
+            latency = summary["latency_ms"]
+            print(f"      {summary['throughput_rps']} req/s | p50 {latency['p50']} ms | "
+                  f"p95 {latency['p95']} ms | p99 {latency['p99']} ms | "
+                  f"errors {summary['error_rate']:.1%} | RSS peak {summary['server_rss_mb']['peak']} MB")
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=4)
+    print(f"\n✅ Results saved to {output}")
+
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+import re
+
+# Fields the resume analysis returns, in output order
+RESUME_FIELDS = [
+    "name", "email", "phone", "skills", "years_of_experience", "job_role",
+    "tech_stack", "education", "certifications", "summary",
+]
+
+# Curated taxonomy: canonical name -> aliases as they appear in resumes.
+# Languages and core skills go to "skills", frameworks and tools to "tech_stack".
+SKILL_TAXONOMY = {
+    "Python": ["python"],
+    "Java": ["java"],
+    "JavaScript": ["javascript", "js", "es6"],
+    "TypeScript": ["typescript"],
+    "C": ["c"],
+    "C++": ["c++", "cpp"],
+    "C#": ["c#", "csharp"],
+    "Go": ["golang"],
+    "Rust": ["rust"],
+    "Kotlin": ["kotlin"],
+    "Swift": ["swift"],
+    "PHP": ["php"],
+    "Ruby": ["ruby"],
+    "R": ["r programming"],
+    "Scala": ["scala"],
+    "Dart": ["dart"],
+    "SQL": ["sql"],
+    "HTML": ["html", "html5"],
+    "CSS": ["css", "css3"],
+    "Bash": ["bash", "shell scripting"],
+    "Git": ["git"],
+    "Linux": ["linux"],
+    "REST APIs": ["rest", "restful", "rest api", "rest apis"],
+    "GraphQL": ["graphql"],
+    "Machine Learning": ["machine learning", "ml"],
+    "Deep Learning": ["deep learning"],
+    "NLP": ["nlp", "natural language processing"],
+    "Computer Vision": ["computer vision"],
+    "Data Analysis": ["data analysis", "data analytics"],
+    "Data Structures": ["data structures", "dsa"],
+    "Algorithms": ["algorithms"],
+    "Microservices": ["microservices"],
+    "CI/CD": ["ci/cd", "ci cd"],
+    "Agile": ["agile", "scrum"],
+}
+
+TECH_STACK_TAXONOMY = {
+    "React": ["react", "react.js", "reactjs"],
+    "React Native": ["react native"],
+    "Angular": ["angular", "angularjs"],
+    "Vue": ["vue", "vue.js", "vuejs"],
+    "Next.js": ["next.js", "nextjs"],
+    "Node.js": ["node", "node.js", "nodejs"],
+    "Express": ["express", "express.js", "expressjs"],
+    "Django": ["django"],
+    "Flask": ["flask"],
+    "FastAPI": ["fastapi"],
+    "Spring Boot": ["spring boot", "springboot"],
+    "Spring": ["spring"],
+    ".NET": [".net", "asp.net", "dotnet"],
+    "Laravel": ["laravel"],
+    "Rails": ["rails", "ruby on rails"],
+    "Flutter": ["flutter"],
+    "Bootstrap": ["bootstrap"],
+    "Tailwind CSS": ["tailwind", "tailwindcss"],
+    "jQuery": ["jquery"],
+    "Redux": ["redux"],
+    "TensorFlow": ["tensorflow"],
+    "PyTorch": ["pytorch"],
+    "scikit-learn": ["scikit-learn", "sklearn"],
+    "Pandas": ["pandas"],
+    "NumPy": ["numpy"],
+    "OpenCV": ["opencv"],
+    "Selenium": ["selenium"],
+    "MySQL": ["mysql"],
+    "PostgreSQL": ["postgresql", "postgres"],
+    "MongoDB": ["mongodb", "mongo"],
+    "SQLite": ["sqlite"],
+    "Redis": ["redis"],
+    "Firebase": ["firebase"],
+    "Docker": ["docker"],
+    "Kubernetes": ["kubernetes", "k8s"],
+    "AWS": ["aws", "amazon web services"],
+    "Azure": ["azure"],
+    "GCP": ["gcp", "google cloud"],
+    "Oracle Cloud": ["oci", "oracle cloud"],
+    "Jenkins": ["jenkins"],
+    "Terraform": ["terraform"],
+    "GitHub": ["github"],
+    "GitHub Actions": ["github actions"],
+    "Jira": ["jira"],
+    "Figma": ["figma"],
+    "Postman": ["postman"],
+    "Kafka": ["kafka"],
+    "Spark": ["spark", "pyspark"],
+    "Tableau": ["tableau"],
+    "Power BI": ["power bi", "powerbi"],
+}
+
+
+def _build_matcher(taxonomies):
+    """
+    Compiles every alias of every taxonomy into one alternation, longest first,
+    so each line is scanned in a single pass.
+    """
+    lookup = {}
+    for category, taxonomy in taxonomies.items():
+        for canonical, aliases in taxonomy.items():
+            for alias in aliases:
+                lookup[alias] = (category, canonical)
+    aliases = sorted(lookup, key=len, reverse=True)
+    # Custom boundaries: "\b" breaks on aliases like "c++", "c#" and ".net"
+    pattern = r"(?<![\w+#.])(" + "|".join(re.escape(a) for a in aliases) + r")(?![\w+#]|\.\w)"
+    return re.compile(pattern, re.IGNORECASE), lookup
+
+
+SKILL_PATTERN, SKILL_LOOKUP = _build_matcher({"skills": SKILL_TAXONOMY, "tech_stack": TECH_STACK_TAXONOMY})
+
+# Aliases that are also everyday words ("Rest of the team", "Spring 2021",
+# "Grade: C"). They must be capitalised and appear either in the Skills
+# section or as an item of their own in a comma-separated list.
+AMBIGUOUS_ALIASES = {"c", "r programming", "rust", "swift", "ruby", "dart", "express", "spring", "spark", "node", "rest", "ml", "agile", "scrum", "rails", "flask", "react", "angular", "vue", "redux", "mongo"}
+
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE_PATTERN = re.compile(r"(?<!\d)(?:\+?\d{1,3}[\s.-]?)?(?:\(\d{2,5}\)[\s.-]?)?\d{3,5}[\s.-]?\d{3,5}(?:[\s.-]?\d{2,4})?(?!\d)")
+EXPERIENCE_PATTERN = re.compile(r"(\d{1,2})\+?\s*(?:years?|yrs?)(?:\s+of)?\s+(?:\w+\s+){0,3}?experience", re.IGNORECASE)
+NAME_PATTERN = re.compile(r"^[A-Z][A-Za-z.'-]+(?:\s+[A-Z][A-Za-z.'-]*){1,3}$")
+# Title-case lines at the top of a resume that are not the candidate's name
+NOT_A_NAME_PATTERN = re.compile(
+    r"\b(?:resume|r[ée]sum[ée]|curriculum|vitae|cv|bio-?data|profile|portfolio|"
+    r"engineer|developer|programmer|manager|analyst|designer|consultant|intern|architect|"
+    r"scientist|specialist|lead|administrator|officer|director|executive|associate|"
+    r"senior|junior|full stack|front end|back end|software|data)\b",
+    re.IGNORECASE,
+)
+LIST_SEPARATOR = re.compile(r"\s*[,;|/]\s*")
+YEAR_PATTERN = re.compile(r"^(?:19|20)\d{2}$")
+DEGREE_PATTERN = re.compile(
+    r"\b(?:B\.?\s?Tech|M\.?\s?Tech|B\.E\.?|M\.E\.?|B\.?Sc|M\.?Sc|B\.?S\.|M\.?S\.|BCA|MCA|B\.?Com|MBA|Ph\.?D|"
+    r"Bachelor(?:'?s)?|Master(?:'?s)?|Diploma|Associate Degree|Doctor of)(?![a-z])"
+)
+CERTIFICATION_PATTERN = re.compile(r"\b(?:Certified|Certification|Certificate)\b", re.IGNORECASE)
+SECTION_PATTERN = re.compile(
+    r"^(?:education|academic|experience|work experience|employment|projects?|skills|technical skills|"
+    r"certifications?|licenses|achievements|awards|summary|profile|objective|languages|interests|hobbies)\b",
+    re.IGNORECASE,
+)
+
+
+def _lines(text):
+    return [line.strip(" \t•·-*|") for line in text.splitlines() if line.strip(" \t•·-*|")]
+
+
+def extract_name(lines):
+    # The name is almost always the first short title-case line of the resume
+    for line in lines[:5]:
+        if NAME_PATTERN.match(line) and not SECTION_PATTERN.match(line) and not NOT_A_NAME_PATTERN.search(line):
+            return line
+    return None
+
+
+def extract_phone(text):
+    for match in PHONE_PATTERN.finditer(text):
+        groups = re.findall(r"\d+", match.group())
+        # "2018-2020 2020-2023" is an employment date range, not a number
+        if sum(1 for g in groups if YEAR_PATTERN.match(g)) >= 2:
+            continue
+        if 10 <= len("".join(groups)) <= 15:
+            return match.group().strip()
+    return None
+
+
+def _list_items(line):
+    # "Frameworks: Flask, React, Express" -> {"flask", "react", "express"}
+    tail = line.split(":", 1)[-1]
+    if not LIST_SEPARATOR.search(tail):
+        return set()
+    return {item.strip(" .").lower() for item in LIST_SEPARATOR.split(tail)}
+
+
+def extract_skills(lines):
+    skills, tech_stack = [], []
+    skills_section = set(_section_lines(lines, ("skills", "technical skills")))
+    for line in lines:
+        for match in SKILL_PATTERN.finditer(line):
+            alias = match.group(1).lower()
+            if alias in AMBIGUOUS_ALIASES:
+                if match.group(1).islower():
+                    continue
+                if line not in skills_section and alias not in _list_items(line):
+                    continue
+            category, canonical = SKILL_LOOKUP[alias]
+            bucket = skills if category == "skills" else tech_stack
+            if canonical not in bucket:
+                bucket.append(canonical)
+    return skills, tech_stack
+
+
+def _section_lines(lines, heading):
+    # heading is a prefix, or a tuple of prefixes, of the section title
+    collected, inside = [], False
+    for line in lines:
+        section = SECTION_PATTERN.match(line)
+        if section:
+            inside = section.group().lower().startswith(heading)
+            continue
+        if inside:
+            collected.append(line)
+    return collected
+
+
+def extract_education(lines):
+    return [line for line in lines if DEGREE_PATTERN.search(line) and len(line) < 150]
+
+
+def extract_certifications(lines):
+    certs = [line for line in _section_lines(lines, "certif") if len(line) < 150]
+    for line in lines:
+        if CERTIFICATION_PATTERN.search(line) and len(line) < 150 and line not in certs:
+            certs.append(line)
+    return certs
+
+
+def extract_years_of_experience(text):
+    years = [int(m.group(1)) for m in EXPERIENCE_PATTERN.finditer(text)]
+    return max(years) if years else None
+
+
+def extract_resume_fields(resume_text):
+    """
+    Fills every resume field that can be found without AI.
+    Fields it cannot find are left out.
+    """
+    lines = _lines(resume_text)
+    skills, tech_stack = extract_skills(lines)
+    email = EMAIL_PATTERN.search(resume_text)
+
+    found = {
+        "name": extract_name(lines),
+        "email": email.group() if email else None,
+        "phone": extract_phone(resume_text),
+        "skills": skills,
+        "years_of_experience": extract_years_of_experience(resume_text),
+        "tech_stack": tech_stack,
+        "education": extract_education(lines),
+        "certifications": extract_certifications(lines),
+    }
+    return {k: v for k, v in found.items() if v not in (None, [], "")}
@@ -0,0 +1,91 @@
+import os
+import json
+import hashlib
+from cryptography.fernet import Fernet, InvalidToken
+from logger import log
+
+# Private state lives outside the app folder, which the static route serves
+DATA_DIR = os.getenv("JOBPILOT_DATA_DIR", os.path.join(os.path.expanduser("~"), ".jobpilot"))
+
+# One encrypted cookie jar per LinkedIn account
+SESSIONS_DIR = os.path.join(DATA_DIR, "sessions")
+
+# Key used to encrypt the cookie jars. Set SESSION_ENCRYPTION_KEY (a Fernet
+# key) in production; otherwise one is generated once and kept in DATA_DIR.
+KEY_FILE = os.path.join(DATA_DIR, "session.key")
+
+
+def _get_fernet():
+    key = os.getenv("SESSION_ENCRYPTION_KEY")
+    if not key:
+        if os.path.exists(KEY_FILE):
+            with open(KEY_FILE, 'rb') as f:
+                key = f.read().strip()
+        else:
+            key = Fernet.generate_key()
+            os.makedirs(os.path.dirname(KEY_FILE), mode=0o700, exist_ok=True)
+            fd = os.open(KEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(key)
+    return Fernet(key)
+
+
+def _session_path(email):
+    # Hash the email so account names don't show up on disk
+    user_id = hashlib.sha256(email.strip().lower().encode("utf-8")).hexdigest()
+    return os.path.join(SESSIONS_DIR, f"{user_id}.session")
+
+
+def has_session(email):
+    return os.path.exists(_session_path(email))
+
+
+def save_session(driver, email):
+    """
+    Encrypts the browser's current cookies and stores them for this user.
+    """
+    try:
+        payload = json.dumps(driver.get_cookies()).encode("utf-8")
+        os.makedirs(SESSIONS_DIR, mode=0o700, exist_ok=True)
+        path = _session_path(email)
+        fd = os.open(path + ".tmp", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_get_fernet().encrypt(payload))
+        os.replace(path + ".tmp", path)
+        log("💾 Session saved for next run")
+    except Exception as e:
+        log(f"⚠️ Could not save session: {e}")
+
+
+def load_session(driver, email):
+    """
+    Loads the user's stored cookies into the browser.
+    The browser must already be on the site the cookies belong to.
+    Returns False if there is no usable stored session.
+    """
+    path = _session_path(email)
+    if not os.path.exists(path):
+        return False
+
+    try:
+        with open(path, 'rb') as f:
+            cookies = json.loads(_get_fernet().decrypt(f.read()))
+    except (InvalidToken, ValueError, OSError):
+        log("⚠️ Stored session is unreadable, discarding it")
+        clear_session(email)
+        return False
+
+    for cookie in cookies:
+        if "expiry" in cookie:
+            cookie["expiry"] = int(cookie["expiry"])
+        try:
+            driver.add_cookie(cookie)
+        except Exception:
+            pass
+    return True
+
+
+def clear_session(email):
+    path = _session_path(email)
+    if os.path.exists(path):
+        os.remove(path)
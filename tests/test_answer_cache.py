@@ -0,0 +1,88 @@
+import pytest
+
+from answer_cache import AnswerCache, CHECKBOX_QUESTION
+
+PROFILE = {"name": "Kiran Kumar", "skills": ["Python", "AWS"], "application_count": 3}
+
+
+def make_cache(tmp_path):
+    return AnswerCache(path=str(tmp_path / "answer_cache.jsonl"))
+
+
+def test_reuses_answer_for_reworded_numeric_question(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.store("Years of experience with Python", PROFILE, "5")
+
+    assert cache.lookup("How many years have you worked with Python?", PROFILE) == "5"
+    assert cache.lookup("Python experience (years)", PROFILE) == "5"
+
+
+def test_different_skill_does_not_share_answer(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.store("Years of experience with Python", PROFILE, "5")
+
+    assert cache.lookup("Years of experience with Java", PROFILE) is None
+
+
+def test_yes_no_question_does_not_reuse_numeric_answer(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.store("How many years of experience do you have with Python?", PROFILE, "5")
+
+    assert cache.lookup("Do you have experience with Python?", PROFILE) is None
+
+
+def test_numeric_question_does_not_reuse_yes_no_answer(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.store("Have you used AWS?", PROFILE, "Yes")
+
+    assert cache.lookup("How many years have you used AWS?", PROFILE) is None
+    assert cache.lookup("Have you worked with AWS?", PROFILE) == "Yes"
+
+
+def test_answers_are_per_profile_and_ignore_run_stats(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.store("Years of experience with Python", PROFILE, "5")
+
+    assert cache.lookup("Years of experience with Python", dict(PROFILE, application_count=9)) == "5"
+    assert cache.lookup("Years of experience with Python", dict(PROFILE, name="Someone Else")) is None
+
+
+def test_answers_survive_reload_and_keep_their_type(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.store("How many years have you used AWS?", PROFILE, "3")
+    cache.store("Have you used AWS?", PROFILE, "Yes")
+
+    reloaded = make_cache(tmp_path)
+    assert reloaded.lookup("AWS experience (years)", PROFILE) == "3"
+    assert reloaded.lookup("Do you have AWS experience?", PROFILE) == "Yes"
+
+
+def test_checkbox_prompts_only_match_the_same_label(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.store(CHECKBOX_QUESTION.format("Remote"), PROFILE, "Yes")
+    cache.store(CHECKBOX_QUESTION.format("Python"), PROFILE, "Yes")
+
+    assert cache.lookup(CHECKBOX_QUESTION.format("Onsite"), PROFILE) is None
+    assert cache.lookup(CHECKBOX_QUESTION.format("Java"), PROFILE) is None
+    assert cache.lookup(CHECKBOX_QUESTION.format("Remote"), PROFILE) == "Yes"
+    assert make_cache(tmp_path).lookup(CHECKBOX_QUESTION.format("remote"), PROFILE) == "Yes"
+
+
+@pytest.mark.parametrize("stored, asked", [
+    ("Are you currently employed?", "Are you currently unemployed?"),
+    ("Are you a US citizen?", "Are you not a US citizen?"),
+    ("Are you authorized to work in India?", "Are you authorized to work in Indiana?"),
+])
+def test_yes_no_questions_with_different_meaning_do_not_match(tmp_path, stored, asked):
+    cache = make_cache(tmp_path)
+    cache.store(stored, PROFILE, "Yes")
+
+    assert cache.lookup(asked, PROFILE) is None
+    assert cache.lookup(stored, PROFILE) == "Yes"
+
+
+def test_negated_text_question_does_not_match(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.store("Which relocation options suit you", PROFILE, "Bangalore")
+
+    assert cache.lookup("Which relocation options don't suit you", PROFILE) is None
@@ -0,0 +1,26 @@
+import answer_pipeline
+from answer_pipeline import AnswerPipeline
+
+
+def test_same_question_is_asked_once_per_run(monkeypatch):
+    calls = []
+    monkeypatch.setattr(answer_pipeline, "get_ai_answer", lambda q, user_data: calls.append(q) or "5")
+    pipeline = AnswerPipeline({})
+
+    assert pipeline.answer("Years of Python").result() == "5"
+    assert pipeline.answer("Years of Python").result() == "5"
+    assert calls == ["Years of Python"]
+    pipeline.close()
+
+
+def test_corrected_answer_replaces_rejected_one(monkeypatch):
+    calls = []
+    monkeypatch.setattr(answer_pipeline, "get_ai_answer", lambda q, user_data: calls.append(q) or "5 years")
+    pipeline = AnswerPipeline({})
+
+    assert pipeline.answer("Years of Python").result() == "5 years"
+    pipeline.correct("Years of Python", "5")
+
+    assert pipeline.answer("Years of Python").result() == "5"
+    assert calls == ["Years of Python"]
+    pipeline.close()
@@ -0,0 +1,115 @@
+import io
+import os
+import json
+import time
+import zipfile
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.datastructures import FileStorage
+
+import bulk_ingest
+from load_test import make_sample_pdf, SAMPLE_RESUME_LINES
+
+PDF = make_sample_pdf(SAMPLE_RESUME_LINES)
+
+
+def zip_upload(members, filename="batch.zip"):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    buffer.seek(0)
+    return FileStorage(stream=buffer, filename=filename)
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(bulk_ingest, "analyze_resume_with_openai", lambda text: {"name": "Alex Morgan"})
+    return tmp_path
+
+
+def test_zip_and_pdf_uploads_become_candidate_records(workdir):
+    files = [
+        zip_upload({"a.pdf": PDF, "../../escape.pdf": PDF, "notes.txt": b"x"}),
+        FileStorage(stream=io.BytesIO(PDF), filename="one.pdf"),
+    ]
+
+    result = bulk_ingest.ingest_resumes(files)
+
+    assert result["total"] == 3 and result["succeeded"] == 3
+    statuses = {r["file"]: r["status"] for r in result["results"]}
+    assert statuses["notes.txt"] == "skipped"
+    records = os.listdir(workdir / "candidates")
+    assert len([r for r in records if r.endswith(".json")]) == 3
+    assert not (workdir / "escape.pdf").exists()
+    record = json.loads((workdir / "candidates" / [r for r in records if r.endswith(".json")][0]).read_text())
+    assert record["batch_id"] == result["batch_id"] and record["application_count"] == 0
+
+
+def test_too_many_resumes_rejected_before_extracting(workdir, monkeypatch):
+    monkeypatch.setattr(bulk_ingest, "MAX_BULK_FILES", 2)
+
+    with pytest.raises(ValueError, match="Too many resumes"):
+        bulk_ingest.ingest_resumes([zip_upload({f"{i}.pdf": PDF for i in range(3)})])
+
+    assert not (workdir / "candidates").exists()
+
+
+def test_oversized_zip_rejected_before_extracting(workdir, monkeypatch):
+    monkeypatch.setattr(bulk_ingest, "MAX_BULK_BYTES", len(PDF) * 2)
+
+    with pytest.raises(ValueError, match="Batch too large"):
+        bulk_ingest.ingest_resumes([zip_upload({f"{i}.pdf": PDF for i in range(3)})])
+
+    assert not (workdir / "candidates").exists()
+
+
+def test_oversized_member_rejected(workdir, monkeypatch):
+    monkeypatch.setattr(bulk_ingest, "MAX_RESUME_BYTES", 100)
+
+    with pytest.raises(ValueError, match="larger than"):
+        bulk_ingest.ingest_resumes([zip_upload({"big.pdf": PDF})])
+
+
+def test_failed_count_includes_broken_zips(workdir):
+    files = [
+        FileStorage(stream=io.BytesIO(b"not a zip"), filename="broken.zip"),
+        FileStorage(stream=io.BytesIO(b"%PDF-1.4 garbage"), filename="empty.pdf"),
+        FileStorage(stream=io.BytesIO(PDF), filename="one.pdf"),
+    ]
+
+    result = bulk_ingest.ingest_resumes(files)
+
+    assert result["succeeded"] == 1
+    assert result["failed"] == 2
+    assert [r["file"] for r in result["results"]] == ["broken.zip", "empty.pdf", "one.pdf"]
+
+
+def test_analysis_starts_before_all_resumes_are_parsed(workdir, monkeypatch):
+    events = []
+
+    class InlineProcessPool(ThreadPoolExecutor):
+        # Same interface, but parse order and timing are observable in-process
+        def __init__(self, max_workers=None, mp_context=None):
+            assert mp_context.get_start_method() == "spawn"
+            super().__init__(max_workers=1)
+
+    def slow_extract(path):
+        events.append(("parsed", os.path.basename(path)))
+        time.sleep(0.1)
+        return "Alex Morgan\nPython"
+
+    def analyze(text):
+        events.append(("analyzed",))
+        return {"name": "Alex Morgan"}
+
+    monkeypatch.setattr(bulk_ingest, "ProcessPoolExecutor", InlineProcessPool)
+    monkeypatch.setattr(bulk_ingest, "extract_text_from_pdf", slow_extract)
+    monkeypatch.setattr(bulk_ingest, "analyze_resume_with_openai", analyze)
+
+    bulk_ingest.ingest_resumes([zip_upload({f"{i}.pdf": PDF for i in range(4)})])
+
+    first_analysis = events.index(("analyzed",))
+    last_parse = max(i for i, e in enumerate(events) if e[0] == "parsed")
+    assert first_analysis < last_parse
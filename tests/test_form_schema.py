@@ -0,0 +1,109 @@
+import form_schema
+
+
+def field(tag="input", type="text", id="", name="", label="", placeholder=""):
+    return {"tag": tag, "type": type, "id": id, "name": name, "placeholder": placeholder, "label": label}
+
+
+DEMO_FORM = [
+    field(id="fullname", name="fullname", label="Full Name"),
+    field(type="email", id="email", name="email", label="Email Address"),
+    field(id="phone", name="phone", label="Phone Number"),
+    field(tag="textarea", type="textarea", id="cover_letter", name="cover_letter", label="Cover Letter / Summary"),
+    field(type="file", id="resume", name="resume", label="Upload Resume"),
+]
+
+
+def test_demo_form_maps_without_ai():
+    schema = form_schema.discover_schema("file", form_schema.fingerprint_form(DEMO_FORM), DEMO_FORM)
+
+    assert schema["fields"] == {"0": "name", "1": "email", "2": "phone", "3": "summary", "4": "resume"}
+
+
+def test_checkboxes_radios_and_selects_are_not_mapped(monkeypatch):
+    monkeypatch.setattr(form_schema, "get_ai_select_choice", lambda *args: "email")
+    fields = [
+        field(type="checkbox", id="contact_email", label="Contact me by email"),
+        field(type="radio", id="phone_pref", label="Phone preferred"),
+        field(tag="select", type="select-one", id="country", label="Country"),
+    ]
+
+    assert form_schema.discover_schema("example.com", "x", fields)["fields"] == {}
+
+
+def test_fingerprint_ignores_labels_but_not_structure():
+    relabelled = [dict(f, label=f["label"].upper()) for f in DEMO_FORM]
+    reordered = DEMO_FORM[1:] + DEMO_FORM[:1]
+
+    assert form_schema.fingerprint_form(relabelled) == form_schema.fingerprint_form(DEMO_FORM)
+    assert form_schema.fingerprint_form(reordered) != form_schema.fingerprint_form(DEMO_FORM)
+
+
+def test_keywords_match_whole_words_only(monkeypatch):
+    monkeypatch.setattr(form_schema, "get_ai_select_choice", lambda *args: "none")
+    fields = [
+        field(id="company", label="Current Company Name"),
+        field(id="referrer", label="Referral name"),
+        field(id="newsletter", label="Newsletter"),
+        field(id="applicant_email", label=""),
+        field(id="name", name="name", label="Name *"),
+    ]
+
+    assert form_schema.discover_schema("example.com", "x", fields)["fields"] == {"3": "email", "4": "name"}
+
+
+class FakeFormDriver:
+    """
+    Answers the describe and fill scripts of form_schema for a fixed form.
+    """
+
+    def __init__(self, fields, url="https://jobs.example.com/apply/1"):
+        self.fields = fields
+        self.current_url = url
+        self.scripts = []
+        self.filled = None
+
+    def execute_script(self, script, *args):
+        if script == form_schema._DESCRIBE_FORM_JS:
+            self.scripts.append("describe")
+            return self.fields
+        if script == form_schema._FILL_FORM_JS:
+            self.scripts.append("fill")
+            self.filled = args[0]
+            return []
+        raise AssertionError("unexpected script")
+
+
+def test_second_visit_replays_schema_without_ai(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ai_calls = []
+    monkeypatch.setattr(form_schema, "get_ai_select_choice", lambda *args: ai_calls.append(args) or "skills")
+    form = DEMO_FORM + [field(id="q7", label="What do you build with?")]
+    user = {"name": "Jane Doe", "email": "jane@example.com", "skills": ["Python", "SQL"]}
+
+    form_schema.fill_form(FakeFormDriver(form), user, "/tmp/resume.pdf")
+    assert len(ai_calls) == 1
+
+    ai_calls.clear()
+    driver = FakeFormDriver(form)
+    form_schema.fill_form(driver, user, "/tmp/resume.pdf")
+
+    assert ai_calls == []
+    assert driver.scripts == ["describe", "fill"]
+    assert driver.filled["5"] == "Python, SQL"
+
+
+def test_changed_form_is_learned_again(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ai_calls = []
+    monkeypatch.setattr(form_schema, "get_ai_select_choice", lambda *args: ai_calls.append(args) or "none")
+    user = {"name": "Jane Doe", "email": "jane@example.com"}
+
+    form_schema.fill_form(FakeFormDriver(DEMO_FORM), user, "/tmp/resume.pdf")
+    changed = DEMO_FORM + [field(id="q1", label="Why do you want this job?")]
+    driver = FakeFormDriver(changed)
+    form_schema.fill_form(driver, user, "/tmp/resume.pdf")
+
+    assert len(ai_calls) == 1
+    assert len(form_schema._load_schemas()) == 2
+    assert driver.filled["0"] == "Jane Doe"
@@ -0,0 +1,120 @@
+import os
+import json
+import pytest
+from selenium.common.exceptions import NoSuchWindowException
+
+import checkpoint
+import linkedin_bot
+
+EMAIL = "candidate@example.com"
+
+
+class FakeElement:
+    def __init__(self, browser, job_id=None):
+        self.browser = browser
+        self.job_id = job_id
+
+    def get_attribute(self, name):
+        return self.job_id if name == "data-job-id" else None
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def click(self):
+        if self.job_id:
+            self.browser.clicks.append(self.job_id)
+            if self.job_id in self.browser.crash_on:
+                raise NoSuchWindowException("no such window: target window already closed")
+
+
+class FakeBrowser:
+    """
+    Stands in for Chrome: a search page with a fixed list of job cards.
+    Clicking a card listed in crash_on kills the window.
+    """
+
+    def __init__(self, job_ids, crash_on):
+        self.job_ids = job_ids
+        self.crash_on = set(crash_on)
+        self.clicks = []
+        self.drivers_started = 0
+
+    def new_driver(self):
+        self.drivers_started += 1
+        return FakeDriver(self)
+
+
+class FakeDriver:
+    def __init__(self, browser):
+        self.browser = browser
+
+    def get(self, url):
+        pass
+
+    def find_elements(self, by, selector):
+        if selector == ".job-card-container":
+            return [FakeElement(self.browser, job_id) for job_id in self.browser.job_ids]
+        return []
+
+    def find_element(self, by, selector):
+        return FakeElement(self.browser)
+
+    def quit(self):
+        pass
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with open("user_data.json", "w") as f:
+        json.dump({"name": "Test", "job_role": "Software Engineer", "application_count": 0, "is_premium": True}, f)
+    monkeypatch.setattr(linkedin_bot.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(linkedin_bot, "login", lambda driver, wait, email, password: None)
+    monkeypatch.setattr(linkedin_bot, "fill_application_modal", lambda *args: None)
+    return tmp_path
+
+
+def test_resumed_run_skips_completed_jobs_after_browser_crash(workdir, monkeypatch):
+    browser = FakeBrowser(["j1", "j2", "j3", "j4", "j5"], crash_on=["j3"])
+    monkeypatch.setattr(linkedin_bot, "create_driver", browser.new_driver)
+
+    linkedin_bot.run_linkedin_bot(EMAIL, "secret")
+
+    # j1 and j2 are never clicked again after the restarts
+    assert browser.clicks.count("j1") == 1
+    assert browser.clicks.count("j2") == 1
+    # j3 crashed the browser, was retried once, then skipped
+    assert browser.clicks.count("j3") == linkedin_bot.MAX_JOB_ATTEMPTS
+    assert browser.clicks == ["j1", "j2", "j3", "j3", "j4", "j5"]
+    assert browser.drivers_started == 3
+    # The finished batch leaves no checkpoint behind
+    assert not os.path.exists(checkpoint._checkpoint_path(EMAIL))
+
+
+def test_new_run_resumes_from_checkpoint_left_by_crashed_process(workdir, monkeypatch):
+    saved = checkpoint.new_checkpoint("Software Engineer")
+    saved["processed_job_ids"] = ["j1", "j2"]
+    checkpoint.save_checkpoint(EMAIL, saved)
+
+    browser = FakeBrowser(["j1", "j2", "j3"], crash_on=[])
+    monkeypatch.setattr(linkedin_bot, "create_driver", browser.new_driver)
+
+    linkedin_bot.run_linkedin_bot(EMAIL, "secret")
+
+    assert browser.clicks == ["j3"]
+    assert not os.path.exists(checkpoint._checkpoint_path(EMAIL))
+
+
+def test_checkpoints_are_kept_per_account(workdir):
+    first = checkpoint.new_checkpoint("Software Engineer")
+    first["processed_job_ids"] = ["j1"]
+    checkpoint.save_checkpoint(EMAIL, first)
+    checkpoint.save_checkpoint("other@example.com", checkpoint.new_checkpoint("Software Engineer"))
+    checkpoint.clear_checkpoint("other@example.com")
+
+    assert checkpoint.load_checkpoint(EMAIL, "Software Engineer")["processed_job_ids"] == ["j1"]
+    with open(checkpoint._checkpoint_path(EMAIL)) as f:
+        assert EMAIL not in f.read()
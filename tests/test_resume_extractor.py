@@ -0,0 +1,63 @@
+import pytest
+from resume_extractor import extract_phone, extract_resume_fields
+
+RESUME = """Kiran Kumar
+kk9840042@gmail.com | +91 85906 58979 | Bengaluru
+SUMMARY
+Motivated developer with 2+ years of professional experience building web apps.
+SKILLS
+Python, JavaScript, C++, HTML5, CSS, SQL, Git, react and node
+Frameworks: Flask, React.js, Node.js, Docker, AWS
+EDUCATION
+B.Tech in Computer Science - Punjab Technical University
+CERTIFICATIONS
+Oracle Certified Cloud Practitioner
+"""
+
+
+def test_extracts_local_fields():
+    data = extract_resume_fields(RESUME)
+
+    assert data["name"] == "Kiran Kumar"
+    assert data["email"] == "kk9840042@gmail.com"
+    assert data["phone"] == "+91 85906 58979"
+    assert data["years_of_experience"] == 2
+    assert data["skills"] == ["Python", "JavaScript", "C++", "HTML", "CSS", "SQL", "Git"]
+    assert data["tech_stack"] == ["Flask", "React", "Node.js", "Docker", "AWS"]
+    assert data["education"] == ["B.Tech in Computer Science - Punjab Technical University"]
+    assert data["certifications"] == ["Oracle Certified Cloud Practitioner"]
+    assert "job_role" not in data and "summary" not in data
+
+
+def test_document_titles_and_job_titles_are_not_names():
+    assert extract_resume_fields("Curriculum Vitae\nJane Doe\njane@example.com")["name"] == "Jane Doe"
+    assert extract_resume_fields("Resume\nSenior Software Engineer\nJane Doe")["name"] == "Jane Doe"
+    assert "name" not in extract_resume_fields("Curriculum Vitae\nSenior Data Analyst\n")
+
+
+def test_date_ranges_are_not_phone_numbers():
+    assert extract_phone("Acme Corp 2018-2020 2020-2023") is None
+    assert extract_phone("Acme Corp 2018-2020\nPhone: 415-555-0132 ext") == "415-555-0132"
+    assert extract_phone("Mobile 8590658979") == "8590658979"
+
+
+@pytest.mark.parametrize("line", [
+    "Rest of the team shipped on time",
+    "Spring 2021 internship at Acme",
+    "Express Delivery Pvt Ltd",
+    "Grade: C",
+    "Section C",
+    "I can React quickly to incidents",
+])
+def test_everyday_words_outside_skill_lists_are_not_skills(line):
+    data = extract_resume_fields(f"Jane Doe\nEXPERIENCE\n{line}\n")
+
+    assert "skills" not in data and "tech_stack" not in data
+
+
+def test_ambiguous_skills_are_kept_in_lists_and_the_skills_section():
+    resume = "Jane Doe\nTECHNICAL SKILLS\nC\nSpring\nPROJECTS\nBuilt APIs with Python, Express, REST\nLanguages: C, Rust\n"
+    data = extract_resume_fields(resume)
+
+    assert data["skills"] == ["C", "Python", "REST APIs", "Rust"]
+    assert data["tech_stack"] == ["Spring", "Express"]
@@ -0,0 +1,123 @@
+import pytest
+from cryptography.fernet import Fernet
+from selenium.common.exceptions import NoSuchElementException
+
+import app
+import linkedin_bot
+import session_store
+
+EMAIL = "candidate@example.com"
+COOKIES = [{"name": "li_at", "value": "token-123", "domain": ".linkedin.com", "expiry": 1999999999.0}]
+
+
+class FakeElement:
+    def __init__(self, driver, element_id):
+        self.driver = driver
+        self.element_id = element_id
+
+    def send_keys(self, text):
+        pass
+
+    def click(self):
+        self.driver.logged_in = True
+
+
+class FakeDriver:
+    """
+    Stands in for Chrome on linkedin.com. Stored cookies only log in when
+    session_valid is set; typing the password always does.
+    """
+
+    def __init__(self, session_valid=True):
+        self.session_valid = session_valid
+        self.logged_in = False
+        self.visited = []
+        self.cookies = []
+
+    def get(self, url):
+        self.visited.append(url)
+        if url.endswith("/feed/") and self.cookies and self.session_valid:
+            self.logged_in = True
+
+    def get_cookies(self):
+        return list(COOKIES)
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def find_element(self, by, selector):
+        if selector == "global-nav" and not self.logged_in:
+            raise NoSuchElementException(selector)
+        return FakeElement(self, selector)
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv("SESSION_ENCRYPTION_KEY", raising=False)
+    monkeypatch.setattr(session_store, "SESSIONS_DIR", str(tmp_path / "sessions"))
+    monkeypatch.setattr(session_store, "KEY_FILE", str(tmp_path / "session.key"))
+    monkeypatch.setattr(linkedin_bot, "SESSION_PROBE_TIMEOUT", 0)
+    monkeypatch.setattr(linkedin_bot.time, "sleep", lambda seconds: None)
+    return tmp_path
+
+
+def test_cookies_round_trip_encrypted(data_dir):
+    session_store.save_session(FakeDriver(), EMAIL)
+
+    with open(session_store._session_path(EMAIL), "rb") as f:
+        assert b"token-123" not in f.read()
+
+    driver = FakeDriver()
+    assert session_store.load_session(driver, EMAIL)
+    assert driver.cookies == [dict(COOKIES[0], expiry=1999999999)]
+
+
+def test_unreadable_session_is_discarded(data_dir, monkeypatch):
+    monkeypatch.setenv("SESSION_ENCRYPTION_KEY", Fernet.generate_key().decode())
+    session_store.save_session(FakeDriver(), EMAIL)
+
+    monkeypatch.setenv("SESSION_ENCRYPTION_KEY", Fernet.generate_key().decode())
+    driver = FakeDriver()
+    assert not session_store.load_session(driver, EMAIL)
+    assert driver.cookies == []
+    assert not session_store.has_session(EMAIL)
+
+
+def test_valid_session_skips_login(data_dir):
+    session_store.save_session(FakeDriver(), EMAIL)
+
+    driver = FakeDriver(session_valid=True)
+    linkedin_bot.login(driver, None, EMAIL, "secret")
+
+    assert "https://www.linkedin.com/login" not in driver.visited
+
+
+def test_expired_session_is_cleared_and_falls_back_to_login(data_dir, monkeypatch):
+    session_store.save_session(FakeDriver(), EMAIL)
+    cleared = []
+    monkeypatch.setattr(linkedin_bot, "clear_session", lambda email: cleared.append(email) or session_store.clear_session(email))
+
+    driver = FakeDriver(session_valid=False)
+    linkedin_bot.login(driver, linkedin_bot.WebDriverWait(driver, 0), EMAIL, "secret")
+
+    assert cleared == [EMAIL]
+    assert driver.visited[-1] == "https://www.linkedin.com/login"
+    # The fresh login is saved for the next run
+    assert session_store.has_session(EMAIL)
+
+
+def test_no_saved_session_does_not_load_any_page(data_dir):
+    driver = FakeDriver()
+    assert not linkedin_bot.restore_session(driver, EMAIL)
+    assert driver.visited == []
+
+
+@pytest.mark.parametrize("path", ["/.gitignore", "/.session_key", "/user_data.json", "/tests/conftest.py", "/checkpoints/x.json"])
+def test_static_route_does_not_serve_private_files(path):
+    assert app.app.test_client().get(path).status_code == 404
+
+
+def test_static_route_serves_site_pages():
+    client = app.app.test_client()
+    assert client.get("/dashboard.html").status_code == 200
+    assert client.get("/styles.css").status_code == 200